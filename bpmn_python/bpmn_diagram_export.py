@@ -19,7 +19,7 @@ from bpmn_python.graph.classes.events.end_event import EndEvent
 from bpmn_python.graph.classes.events.intermediate_catch_event import IntermediateCatchEvent
 from bpmn_python.graph.classes.events.intermediate_throw_event import IntermediateThrowEvent
 from bpmn_python.graph.classes.events.start_event import StartEvent
-from bpmn_python.graph.classes.flow_node import FlowNode
+from bpmn_python.graph.classes.flow_node import FlowNode, NodeType
 from bpmn_python.graph.classes.gateways.complex_gateway import ComplexGateway
 from bpmn_python.graph.classes.gateways.event_based_gateway import EventBasedGateway
 from bpmn_python.graph.classes.gateways.exclusive_gateway import ExclusiveGateway
@@ -336,7 +336,7 @@ class BpmnDiagramGraphExport(BaseModel):
         :param process: object of Element class, representing BPMN XML 'process' element (root for nodes).
         """
         node_type = node.node_type
-        output_element = eTree.SubElement(process, node_type.value)
+        output_element = eTree.SubElement(process, node.node_type_str)
         output_element.set(consts.Consts.id, process_id)
         if node.name is not None:
             output_element.set(consts.Consts.name, node.name)
@@ -348,28 +348,11 @@ class BpmnDiagramGraphExport(BaseModel):
             outgoing_element = eTree.SubElement(output_element, consts.Consts.outgoing_flow)
             outgoing_element.text = outgoing
 
-        if isinstance(node, Task):
-            BpmnDiagramGraphExport.export_task_info(node, output_element)
-        elif isinstance(node, SubProcess):
-            BpmnDiagramGraphExport.export_subprocess_info(bpmn_diagram, node, output_element)
-        elif isinstance(node, DataObject):
-            BpmnDiagramGraphExport.export_data_object_info(bpmn_diagram, node, output_element)
-        elif isinstance(node, ComplexGateway):
-            BpmnDiagramGraphExport.export_complex_gateway_info(node, output_element)
-        elif isinstance(node, EventBasedGateway):
-            BpmnDiagramGraphExport.export_event_based_gateway_info(node, output_element)
-        elif isinstance(node, InclusiveGateway) or isinstance(node, ExclusiveGateway):
-            BpmnDiagramGraphExport.export_inclusive_exclusive_gateway_info(node, output_element)
-        elif isinstance(node, ParallelGateway):
-            BpmnDiagramGraphExport.export_parallel_gateway_info(node, output_element)
-        elif isinstance(node, StartEvent):
-            BpmnDiagramGraphExport.export_start_event_info(node, output_element)
-        elif isinstance(node, IntermediateCatchEvent):
-            BpmnDiagramGraphExport.export_catch_event_info(node, output_element)
-        elif isinstance(node, EndEvent) or isinstance(node, IntermediateThrowEvent):
-            BpmnDiagramGraphExport.export_throw_event_info(node, output_element)
-        elif isinstance(node, BoundaryEvent):
-            BpmnDiagramGraphExport.export_boundary_event_info(node, output_element)
+        node_type_exporter = _NODE_TYPE_EXPORTERS.get(node_type)
+        if node_type_exporter is not None:
+            node_type_exporter(node, output_element)
+        elif node_type in _NODE_TYPE_DIAGRAM_EXPORTERS:
+            _NODE_TYPE_DIAGRAM_EXPORTERS[node_type](bpmn_diagram, node, output_element)
 
     @staticmethod
     def export_node_di_data(node_id: str, node: FlowNode, plane: Element):
@@ -593,3 +576,27 @@ class BpmnDiagramGraphExport(BaseModel):
             if level and (not elem.tail or not elem.tail.strip()):
                 elem.tail = j
         return elem
+
+
+# Type specific attribute exporters, keyed by node type so export_node_data does a single lookup per node
+_NODE_TYPE_EXPORTERS = {
+    NodeType.TASK: BpmnDiagramGraphExport.export_task_info,
+    NodeType.SERVICE_TASK: BpmnDiagramGraphExport.export_task_info,
+    NodeType.MANUAL_TASK: BpmnDiagramGraphExport.export_task_info,
+    NodeType.USER_TASK: BpmnDiagramGraphExport.export_task_info,
+    NodeType.COMPLEX: BpmnDiagramGraphExport.export_complex_gateway_info,
+    NodeType.EVENT_BASED: BpmnDiagramGraphExport.export_event_based_gateway_info,
+    NodeType.INCLUSIVE: BpmnDiagramGraphExport.export_inclusive_exclusive_gateway_info,
+    NodeType.EXCLUSIVE: BpmnDiagramGraphExport.export_inclusive_exclusive_gateway_info,
+    NodeType.PARALLEL: BpmnDiagramGraphExport.export_parallel_gateway_info,
+    NodeType.START: BpmnDiagramGraphExport.export_start_event_info,
+    NodeType.INTERMEDIATE_CATCH: BpmnDiagramGraphExport.export_catch_event_info,
+    NodeType.END: BpmnDiagramGraphExport.export_throw_event_info,
+    NodeType.INTERMEDIATE_THROW: BpmnDiagramGraphExport.export_throw_event_info,
+    NodeType.BOUNDARY: BpmnDiagramGraphExport.export_boundary_event_info,
+}
+# Exporters that also need the whole diagram
+_NODE_TYPE_DIAGRAM_EXPORTERS = {
+    NodeType.SUB_PROCESS: BpmnDiagramGraphExport.export_subprocess_info,
+    NodeType.DATA_OBJECT: BpmnDiagramGraphExport.export_data_object_info,
+}
@@ -2,6 +2,7 @@
 """
 Package provides functionality for importing from BPMN 2.0 XML to graph representation
 """
+import sys
 from xml.dom import minidom
 from xml.dom.minidom import Element
 
@@ -28,8 +29,8 @@ from bpmn_python.graph.classes.lane_set import LaneSet, Lane
 from bpmn_python.graph.classes.message_flow import MessageFlow
 from bpmn_python.graph.classes.participant import Participant
 from bpmn_python.graph.classes.root_element.event_definition import EventDefinition, EventDefinitionType, \
-    StartEventDefinitionTypes, EndEventDefinitionTypes, IntermediateThrowEventDefinitionTypes, \
-    IntermediateCatchEventDefinitionTypes, BoundaryEventDefinitionTypes
+    START_EVENT_DEFINITION_TYPES, END_EVENT_DEFINITION_TYPES, INTERMEDIATE_THROW_EVENT_DEFINITION_TYPES, \
+    INTERMEDIATE_CATCH_EVENT_DEFINITION_TYPES, BOUNDARY_EVENT_DEFINITION_TYPES
 from bpmn_python.graph.classes.root_element.process import Process, ProcessType
 from bpmn_python.graph.classes.sequence_flow import SequenceFlow
 from bpmn_python.node_creator import create_node, parse_node_type
@@ -112,7 +113,7 @@ class BpmnDiagramGraphImport(BaseModel):
         #     diagram_graph.add_node(participant_id)
         #     diagram_graph.nodes[participant_id][consts.Consts.type] = consts.Consts.participant
         #     diagram_graph.nodes[participant_id][consts.Consts.process] = participant_id
-        participants[participant_id] = Participant(id=participant_id, name=name, process_ref=process_ref)
+        participants[participant_id] = Participant.from_trusted(id=participant_id, name=name, process_ref=process_ref)
 
     @staticmethod
     def import_diagram_and_plane_attributes(diagram_attributes: dict[str, str], plane_attributes: dict[str, str],
@@ -235,7 +236,7 @@ class BpmnDiagramGraphImport(BaseModel):
                     lane = BpmnDiagramGraphImport.import_lane_element(lane_element, plane_element)
                     lanes_dict[lane_id] = lane
 
-        lane_set = LaneSet(id=lane_set_id, lanes=lanes_dict)
+        lane_set = LaneSet.from_trusted(id=lane_set_id, lanes=lanes_dict)
         process.lane_set = lane_set
 
     @staticmethod
@@ -257,7 +258,7 @@ class BpmnDiagramGraphImport(BaseModel):
                     lane = BpmnDiagramGraphImport.import_lane_element(lane_element, plane_element)
                     lanes[lane_id] = lane
 
-        child_lane_set_attr = LaneSet(id=lane_set_id, lanes=lanes)
+        child_lane_set_attr = LaneSet.from_trusted(id=lane_set_id, lanes=lanes)
         return child_lane_set_attr
 
     @staticmethod
@@ -282,7 +283,8 @@ class BpmnDiagramGraphImport(BaseModel):
                     flow_node_ref_id = element.firstChild.nodeValue
                     flow_node_refs.append(flow_node_ref_id)
 
-        lane = Lane(id=lane_id, name=lane_name, child_lane_set=child_lane_set, flow_node_refs=flow_node_refs)
+        lane = Lane.from_trusted(id=lane_id, name=lane_name, child_lane_set=child_lane_set,
+                                flow_node_refs=flow_node_refs)
 
         shape_element = None
         for element in utils.BpmnImportUtils.iterate_elements(plane_element):
@@ -331,8 +333,8 @@ class BpmnDiagramGraphImport(BaseModel):
                 if process_element.hasAttribute(consts.Consts.process_type) else "None"
         )
 
-        process = Process(id=process_id, name=name, is_closed=is_closed, is_executable=is_executable,
-                          process_type=process_type)
+        process = Process.from_trusted(id=process_id, name=name, is_closed=is_closed, is_executable=is_executable,
+                                       process_type=process_type)
         process_elements_dict[process_id] = process
 
     @staticmethod
@@ -351,9 +353,11 @@ class BpmnDiagramGraphImport(BaseModel):
         :param process_id: string object, representing an ID of process element,
         :param flow_node_element: object representing a BPMN XML element corresponding to given flownode,
         """
-        element_id = flow_node_element.getAttribute(consts.Consts.id)
+        # Ids are interned so graph dict keys and the references to them share one string object
+        element_id = sys.intern(flow_node_element.getAttribute(consts.Consts.id))
         node_type = utils.BpmnImportUtils.remove_namespace_from_tag_name(flow_node_element.tagName)
-        node = create_node(node_type=parse_node_type(node_type), node_id=element_id, process_id=process_id)
+        node = create_node(node_type=parse_node_type(node_type), node_id=element_id, process_id=process_id,
+                           trusted=True)
         node.name = flow_node_element.getAttribute(consts.Consts.name) \
             if flow_node_element.hasAttribute(consts.Consts.name) \
             else ""
@@ -366,7 +370,7 @@ class BpmnDiagramGraphImport(BaseModel):
             if tmp_element.nodeType != tmp_element.TEXT_NODE:
                 tag_name = utils.BpmnImportUtils.remove_namespace_from_tag_name(tmp_element.tagName)
                 if tag_name == consts.Consts.incoming_flow:
-                    incoming_value = tmp_element.firstChild.nodeValue
+                    incoming_value = sys.intern(tmp_element.firstChild.nodeValue)
                     incoming_list.append(incoming_value)
         node.incoming = incoming_list
 
@@ -376,7 +380,7 @@ class BpmnDiagramGraphImport(BaseModel):
             if tmp_element.nodeType != tmp_element.TEXT_NODE:
                 tag_name = utils.BpmnImportUtils.remove_namespace_from_tag_name(tmp_element.tagName)
                 if tag_name == consts.Consts.outgoing_flow:
-                    outgoing_value = tmp_element.firstChild.nodeValue
+                    outgoing_value = sys.intern(tmp_element.firstChild.nodeValue)
                     outgoing_list.append(outgoing_value)
         node.outgoing = outgoing_list
 
@@ -415,7 +419,7 @@ class BpmnDiagramGraphImport(BaseModel):
             subprocess_element.getAttribute(consts.Consts.triggered_by_event) \
                 if subprocess_element.hasAttribute(consts.Consts.triggered_by_event) else "false")
 
-        subprocess = SubProcess(id=subprocess_id, triggered_by_event=triggered_by_event)
+        subprocess = SubProcess.from_trusted(id=subprocess_id, triggered_by_event=triggered_by_event)
         diagram_graph.nodes[subprocess_id] = subprocess
 
         for element in utils.BpmnImportUtils.iterate_elements(subprocess_element):
@@ -565,7 +569,7 @@ class BpmnDiagramGraphImport(BaseModel):
 
     @staticmethod
     def import_event_definition_elements(diagram_graph: BpmnDiagramGraph, element: Element,
-                                         event_definitions: set[EventDefinitionType]):
+                                         event_definitions: frozenset[EventDefinitionType]):
         """
         Helper function, that adds event definition elements (defines special types of events) to corresponding events.
 
@@ -578,8 +582,8 @@ class BpmnDiagramGraphImport(BaseModel):
         for definition_type in event_definitions:
             event_def_xml = element.getElementsByTagNameNS("*", definition_type.name)
             for index in range(len(event_def_xml)):
-                event_def_tmp = EventDefinition(id=event_def_xml[index].getAttribute(consts.Consts.id),
-                                                definition_type=definition_type)
+                event_def_tmp = EventDefinition.from_trusted(id=event_def_xml[index].getAttribute(consts.Consts.id),
+                                                             definition_type=definition_type)
                 event_def_list.append(event_def_tmp)
 
         node = diagram_graph.nodes[element_id]
@@ -606,7 +610,7 @@ class BpmnDiagramGraphImport(BaseModel):
         :param element: object representing a BPMN XML 'startEvent' element.
         """
         element_id = element.getAttribute(consts.Consts.id)
-        start_event_definitions = StartEventDefinitionTypes.getTypes()
+        start_event_definitions = START_EVENT_DEFINITION_TYPES
         BpmnDiagramGraphImport.import_flow_node_to_graph(diagram_graph, process_id, element)
 
         node = diagram_graph.nodes[element_id]
@@ -637,7 +641,7 @@ class BpmnDiagramGraphImport(BaseModel):
         :param element: object representing a BPMN XML 'intermediateCatchEvent' element.
         """
         element_id = element.getAttribute(consts.Consts.id)
-        intermediate_catch_event_definitions = IntermediateCatchEventDefinitionTypes.getTypes()
+        intermediate_catch_event_definitions = INTERMEDIATE_CATCH_EVENT_DEFINITION_TYPES
         BpmnDiagramGraphImport.import_flow_node_to_graph(diagram_graph, process_id, element)
 
         node = diagram_graph.nodes[element_id]
@@ -662,7 +666,7 @@ class BpmnDiagramGraphImport(BaseModel):
         :param process_id: string object, representing an ID of process element,
         :param element: object representing a BPMN XML 'endEvent' element.
         """
-        end_event_definitions = EndEventDefinitionTypes.getTypes()
+        end_event_definitions = END_EVENT_DEFINITION_TYPES
         BpmnDiagramGraphImport.import_flow_node_to_graph(diagram_graph, process_id, element)
         BpmnDiagramGraphImport.import_event_definition_elements(diagram_graph, element, end_event_definitions)
 
@@ -678,7 +682,7 @@ class BpmnDiagramGraphImport(BaseModel):
         :param process_id: string object, representing an ID of process element,
         :param element: object representing a BPMN XML 'intermediateThrowEvent' element.
         """
-        intermediate_throw_event_definitions = IntermediateThrowEventDefinitionTypes.getTypes()
+        intermediate_throw_event_definitions = INTERMEDIATE_THROW_EVENT_DEFINITION_TYPES
         BpmnDiagramGraphImport.import_flow_node_to_graph(diagram_graph, process_id, element)
         BpmnDiagramGraphImport.import_event_definition_elements(diagram_graph, element,
                                                                 intermediate_throw_event_definitions)
@@ -696,7 +700,7 @@ class BpmnDiagramGraphImport(BaseModel):
         :param element: object representing a BPMN XML 'endEvent' element.
         """
         element_id = element.getAttribute(consts.Consts.id)
-        boundary_event_definitions = BoundaryEventDefinitionTypes.getTypes()
+        boundary_event_definitions = BOUNDARY_EVENT_DEFINITION_TYPES
         BpmnDiagramGraphImport.import_flow_node_to_graph(diagram_graph, process_id, element)
 
         node = diagram_graph.nodes[element_id]
@@ -731,10 +735,10 @@ class BpmnDiagramGraphImport(BaseModel):
         :param flow_element: object representing a BPMN XML 'sequenceFlow' element.
         """
         sequence_flows = diagram_graph.sequence_flows
-        flow_id = flow_element.getAttribute(consts.Consts.id)
+        flow_id = sys.intern(flow_element.getAttribute(consts.Consts.id))
         name = flow_element.getAttribute(consts.Consts.name) if flow_element.hasAttribute(consts.Consts.name) else ""
-        source_ref = flow_element.getAttribute(consts.Consts.source_ref)
-        target_ref = flow_element.getAttribute(consts.Consts.target_ref)
+        source_ref = sys.intern(flow_element.getAttribute(consts.Consts.source_ref))
+        target_ref = sys.intern(flow_element.getAttribute(consts.Consts.target_ref))
         sequence_flows[flow_id] = SequenceFlow(id=flow_id, name=name, source_ref_id=source_ref,
                                                target_ref_id=target_ref, process_id=process_id)
 
@@ -778,11 +782,12 @@ class BpmnDiagramGraphImport(BaseModel):
         :param flow_element: object representing a BPMN XML 'messageFlow' element.
         """
         message_flows = diagram_graph.message_flows
-        flow_id = flow_element.getAttribute(consts.Consts.id)
+        flow_id = sys.intern(flow_element.getAttribute(consts.Consts.id))
         name = flow_element.getAttribute(consts.Consts.name) if flow_element.hasAttribute(consts.Consts.name) else ""
-        source_ref = flow_element.getAttribute(consts.Consts.source_ref)
-        target_ref = flow_element.getAttribute(consts.Consts.target_ref)
-        message_flows[flow_id] = MessageFlow(id=flow_id, name=name, source_ref_id=source_ref, target_ref_id=target_ref)
+        source_ref = sys.intern(flow_element.getAttribute(consts.Consts.source_ref))
+        target_ref = sys.intern(flow_element.getAttribute(consts.Consts.target_ref))
+        message_flows[flow_id] = MessageFlow.from_trusted(id=flow_id, name=name, source_ref_id=source_ref,
+                                                          target_ref_id=target_ref)
 
         '''
         # Add incoming / outgoing nodes to corresponding elements. May be redundant action since this information is
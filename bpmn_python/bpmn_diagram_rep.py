@@ -712,7 +712,7 @@ class BpmnDiagramGraph(BaseModel):
                 node.name or node_id,
                 **{
                     consts.Consts.process: node.process_id,
-                    consts.Consts.type: node.node_type.value,
+                    consts.Consts.type: node.node_type_str,
                     consts.Consts.id: node.id,
                     consts.Consts.x: node.x,
                     consts.Consts.y: node.y,
@@ -11,6 +11,9 @@ from bpmn_python.bpmn_diagram_layouter import NodeClassification
 from bpmn_python.bpmn_diagram_rep import BpmnDiagramGraph
 from bpmn_python.graph.classes.flow_node import FlowNode
 
+_TRUE_STRINGS = frozenset(("true", "1", "yes", "on"))
+_FALSE_STRINGS = frozenset(("false", "0", "no", "off"))
+
 
 class BpmnImportUtils(object):
     """
@@ -140,9 +143,10 @@ class BpmnImportUtils(object):
     @staticmethod
     def convert_str_to_bool(value: str | bool) -> bool:
         if isinstance(value, str):
-            if value.strip().lower() in {"true", "1", "yes", "on"}:
+            value = value.strip().lower()
+            if value in _TRUE_STRINGS:
                 return True
-            elif value.strip().lower() in {"false", "0", "no", "off"}:
+            elif value in _FALSE_STRINGS:
                 return False
             raise ValueError(
                 "is_expanded must be a boolean value or a string that can be converted to boolean"
@@ -5,30 +5,56 @@ Process Modeling" by Kluza k. and Wisniewski P.
 """
 from __future__ import print_function
 
-import copy
-
-import pandas as pd
+import csv
+import functools
 import re
-import six
+import string
+import sys
+from typing import Iterator
 
 import bpmn_python.bpmn_python_consts as consts
 import bpmn_python.bpmn_diagram_exception as bpmn_exception
 from bpmn_python.bpmn_diagram_rep import BpmnDiagramGraph
 from bpmn_python.graph.classes.condition_expression import ConditionExpression
-from bpmn_python.graph.classes.flow_node import NodeType
+from bpmn_python.graph.classes.flow_node import FlowNode, NodeType
 from bpmn_python.graph.classes.root_element.process import Process, ProcessType
 from bpmn_python.graph.classes.sequence_flow import SequenceFlow
 
-regex_pa_trailing_number = r'^(.*[a-z|A-Z]|[^0-9]?)([0-9]+)$'
-regex_pa_trailing_letter = r'(.+)([a-z|A-Z])'
-regex_pa_merge_node_finder = r'(.*?)([0-9]+[a-z|A-Z])(.*?)'
-regex_pa_num_let = r'([0-9]+)([a-z,A-Z])'
-regex_prefix_split_succ = r'^'
-regex_suffix_split_succ = r'([a-z|A-Z]|[a-z|A-Z][1]+)$'
+# reference patterns for node IDs, reproduced by the string helpers below (see tests/csv_import)
+regex_pa_trailing_number = r'^(.*[a-zA-Z]|[^0-9]?)([0-9]+)$'
+regex_pa_trailing_letter = r'(.+)([a-zA-Z])'
+regex_pa_merge_node_finder = r'(.*?)([0-9]+[a-zA-Z])(.*?)'
+regex_pa_num_let = r'([0-9]+)([a-zA-Z])'
+regex_suffix_split_succ = r'([a-zA-Z]|[a-zA-Z]1+)$'
+
+_RE_SUFFIX_SPLIT_SUCC = re.compile(regex_suffix_split_succ)
+
+# characters matched by [0-9] and [a-zA-Z] in the patterns above
+_digit_chars = frozenset(string.digits)
+_prefix_end_chars = frozenset(string.ascii_letters)
+
+# CSV column names, bound once instead of looked up on Consts for every row
+_CSV_ORDER = consts.Consts.csv_order
+_CSV_ACTIVITY = consts.Consts.csv_activity
+_CSV_CONDITION = consts.Consts.csv_condition
+_CSV_SUBPROCESS = consts.Consts.csv_subprocess
+_CSV_TERMINATED = consts.Consts.csv_terminated
+
+# cells shorter than this are interned while reading CSV rows
+_INTERN_MAX_LENGTH = 32
 
 default_process_id = 'process_1'
 default_plane_id = 'plane_1'
 
+# gateway types created by CSV import
+_GATEWAY_TYPES = frozenset({NodeType.INCLUSIVE, NodeType.EXCLUSIVE, NodeType.PARALLEL})
+
+# kinds of continuation reported by _classify_all
+_END_EVENT = 0
+_SEQUENCE_CONTINUATION = 1
+_SPLIT_CONTINUATION = 2
+_MERGE_CONTINUATION = 3
+
 
 def get_node_type(order: str, csv_line_dict: dict[str, str]) -> NodeType:
     """
@@ -38,11 +64,11 @@ def get_node_type(order: str, csv_line_dict: dict[str, str]) -> NodeType:
     :param csv_line_dict: A dictionary containing attributes of the node from the CSV file.
     :return: A string representing the node type (e.g., start event, end event, task, etc.).
     """
-    if order == str(0):
+    if order == "0":
         return NodeType.START
-    if csv_line_dict[consts.Consts.csv_terminated] == 'yes':
+    if csv_line_dict[_CSV_TERMINATED] == 'yes':
         return NodeType.END
-    if csv_line_dict[consts.Consts.csv_subprocess] == 'yes':
+    if csv_line_dict[_CSV_SUBPROCESS] == 'yes':
         return NodeType.SUB_PROCESS
     else:
         return NodeType.TASK
@@ -92,24 +118,56 @@ def import_nodes_info(process_dict: dict[str, dict[str, str]], bpmn_diagram: Bpm
     """
     for order, csv_line_dict in process_dict.items():
         node_type = get_node_type(order, csv_line_dict)
-        activity = process_dict[order][consts.Consts.csv_activity]
+        activity = csv_line_dict[_CSV_ACTIVITY]
         process_id = default_process_id
         add_node_info_to_diagram_graph(order, node_type, activity, process_id, bpmn_diagram)
 
 
-def remove_white_spaces_in_orders(process_dict: dict[any, dict[str, str]]):
+def _split_trailing_digits(node_id: str) -> tuple[str, str] | None:
     """
-    Removes leading and trailing white spaces from the keys in the process dictionary. Input dictionary is changed in place.
+    Splits node identifier into a prefix and its trailing number with plain string operations.
+    Gives the same result as matching regex_pa_trailing_number: the prefix has to be empty, a single non-digit
+    character, or end with a letter and contain no new line. A single trailing new line is ignored, as "$" does.
 
-    :param process_dict: A dictionary where keys represent process orders and values contain node attributes.
+    :param node_id: The identifier of the node as a string.
+    :return: A (prefix, trailing number) tuple, or None if the identifier does not match.
     """
-    tmp_process_dict = copy.deepcopy(process_dict)
-    for order, csv_line_dict in tmp_process_dict.items():
-        del process_dict[order]
-        if isinstance(order, six.string_types) and order.strip() != order:
-            process_dict[order.strip()] = csv_line_dict
-        else:
-            process_dict[str(order)] = csv_line_dict
+    end = len(node_id) - 1 if node_id.endswith('\n') else len(node_id)
+    start = end
+    while start > 0 and node_id[start - 1] in _digit_chars:
+        start -= 1
+    if start == end:
+        return None
+    prefix = node_id[:start]
+    if len(prefix) > 1 and (prefix[-1] not in _prefix_end_chars or '\n' in prefix):
+        return None
+    return prefix, node_id[start:end]
+
+
+def _has_letter_after_first_char(node_id: str) -> bool:
+    """
+    Checks if the node identifier has a letter after its first character and before the first new line,
+    which is what matching regex_pa_trailing_letter tests.
+
+    :param node_id: The identifier of the node as a string.
+    :return: True if there is such a letter, otherwise False.
+    """
+    end = node_id.find('\n')
+    if end == -1:
+        end = len(node_id)
+    return any(char in _prefix_end_chars for char in node_id[1:end])
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_trailing_number(node_id: str) -> tuple[str, str] | None:
+    """
+    Splits node identifier into a prefix and its trailing number, as matched by regex_pa_trailing_number.
+    Every node identifier is probed several times while graph connections are filled, so results are cached.
+
+    :param node_id: The identifier of the node as a string.
+    :return: A (prefix, trailing number) tuple, or None if the identifier does not end with a number.
+    """
+    return _split_trailing_digits(node_id)
 
 
 def get_possible_sequence_continuation_successor(node_id: str) -> list[str]:
@@ -119,11 +177,10 @@ def get_possible_sequence_continuation_successor(node_id: str) -> list[str]:
     :param node_id: The identifier of the node as a string.
     :return: A list of possible sequence successor identifiers.
     """
-    result = re.match(regex_pa_trailing_number, node_id)
+    result = _parse_trailing_number(node_id)
     if result:
-        last_number_in_order = result.group(2)
+        prefix, last_number_in_order = result
         next_number = str(int(last_number_in_order) + 1)
-        prefix = result.group(1)
         return [prefix + next_number]
     else:
         # possible if e.g. 4a
@@ -137,10 +194,9 @@ def get_possible_split_continuation_successor(node_id: str) -> list[str]:
     :param node_id: The identifier of the node as a string.
     :return: A list of possible split continuation successor identifiers.
     """
-    result = re.match(regex_pa_trailing_number, node_id)
+    result = _parse_trailing_number(node_id)
     if result:
-        trailing_number = result.group(2)
-        prefix = result.group(1)
+        prefix, trailing_number = result
         new_trailing_number = str(int(trailing_number) + 1)
         new_node_id = prefix + new_trailing_number
         return [new_node_id + 'a', new_node_id + 'a1']
@@ -148,6 +204,54 @@ def get_possible_split_continuation_successor(node_id: str) -> list[str]:
         return []
 
 
+def _find_num_letter_spans(node_id: str) -> Iterator[tuple[str, str]]:
+    """
+    Scans the node ID for every run of digits followed by a letter, yielding the same pairs as
+    group 1 and the number part of group 2 in re.finditer(regex_pa_merge_node_finder, node_id).
+    A prefix starts right after the previous match and never spans a new line.
+
+    :param node_id: The identifier of the node as a string.
+    :return: An iterator of (prefix, number) tuples.
+    """
+    length = len(node_id)
+    start = i = 0
+    while i < length:
+        char = node_id[i]
+        if char in _digit_chars:
+            j = i + 1
+            while j < length and node_id[j] in _digit_chars:
+                j += 1
+            if j < length and node_id[j] in _prefix_end_chars:
+                yield node_id[start:i], node_id[i:j]
+                start = j + 1
+                i = start
+            else:
+                i = j
+        else:
+            if char == '\n':
+                start = i + 1
+            i += 1
+
+
+@functools.lru_cache(maxsize=4096)
+def _merge_continuation_successors(node_id: str) -> tuple[str, ...]:
+    """
+    Cached counterpart of get_possible_merge_continuation_successors. Results are returned as a tuple,
+    so a cached value cannot be modified by a caller.
+
+    :param node_id: The identifier of the node as a string.
+    :return: A tuple of possible merge continuation successor identifiers.
+    """
+    result_trailing_number = _parse_trailing_number(node_id)
+    if result_trailing_number:
+        node_id = result_trailing_number[0]
+
+    if _has_letter_after_first_char(node_id):
+        return tuple(prefix + str(int(num) + 1) for prefix, num in _find_num_letter_spans(node_id))
+    else:
+        return ()
+
+
 def get_possible_merge_continuation_successors(node_id_arg: str) -> list[str]:
     """
     Determines potential successors in the case of a merge, based on a numbering and letter pattern.
@@ -155,56 +259,43 @@ def get_possible_merge_continuation_successors(node_id_arg: str) -> list[str]:
     :param node_id_arg: The identifier of the node as a string.
     :return: A list of possible merge continuation successor identifiers.
     """
-    node_id = copy.deepcopy(node_id_arg)
-    result_trailing_number = re.match(regex_pa_trailing_number, node_id)
-    if result_trailing_number:
-        node_id = result_trailing_number.group(1)
-
-    result_trailing_letter = re.match(regex_pa_trailing_letter, node_id)
-    if result_trailing_letter:
-        possible_successors = []
-        for result in re.finditer(regex_pa_merge_node_finder, node_id):
-            num_let_pair = result.group(2)
-            prefix = result.group(1)
-            num_let_result = re.match(regex_pa_num_let, num_let_pair)
-            num = num_let_result.group(1)
-            inc_num = str(int(num) + 1)
-            possible_successors.append(prefix + inc_num)
-        return possible_successors
-    else:
-        return []
+    return list(_merge_continuation_successors(node_id_arg))
 
 
-def is_any_possible_successor_present_in_node_ids(possible_successors: list[str], nodes_ids: list[str]) -> bool:
+def is_any_possible_successor_present_in_node_ids(possible_successors: list[str],
+                                                  nodes_ids: list[str] | set[str]) -> bool:
     """
     Checks if any of the possible successors are present in the given list of node IDs.
 
     :param possible_successors: A list of potential successor node IDs.
-    :param nodes_ids: A list of existing node IDs.
+    :param nodes_ids: A list or a set of existing node IDs.
     :return: True if at least one possible successor is present in the list of node IDs, otherwise False.
     """
-    return len(get_possible_successors_set_present_in_node_ids(possible_successors, nodes_ids)) > 0
+    return any(successor in nodes_ids for successor in possible_successors)
 
 
-def get_possible_successors_set_present_in_node_ids(possible_successors: list[str], nodes_ids: list[str]) -> set[str]:
+def get_possible_successors_set_present_in_node_ids(possible_successors: list[str],
+                                                    nodes_ids: list[str] | set[str]) -> set[str]:
     """
     Identifies which of the potential successor node IDs exist in the provided list of node IDs.
+    There are only a few possible successors, so each of them is looked up in nodes_ids instead of hashing
+    all node IDs. Pass a set to make each lookup constant time.
 
     :param possible_successors: A list of potential successor node IDs.
-    :param nodes_ids: A list of existing node IDs.
+    :param nodes_ids: A list or a set of existing node IDs.
     :return: A set of node IDs that are both in the possible successors and the given node IDs.
     """
-    return set(possible_successors).intersection(set(nodes_ids))
+    return {successor for successor in possible_successors if successor in nodes_ids}
 
 
 def get_possible_successor_present_in_node_ids_or_raise_excp(possible_successors_node_id: list[str],
-                                                             nodes_ids: list[str]) -> str:
+                                                             nodes_ids: list[str] | set[str]) -> str:
     """
     Checks if exactly one of the possible successor node IDs exists in the provided list of node IDs.
     Raises an exception if no successor or more than one successor is found.
 
     :param possible_successors_node_id: A list of potential successor node IDs.
-    :param nodes_ids: A list of existing node IDs.
+    :param nodes_ids: A list or a set of existing node IDs.
     :return: The single node ID that is both in the possible successors and the given node IDs.
     :raises BpmnPythonError: If there is not exactly one matching successor.
     """
@@ -215,64 +306,101 @@ def get_possible_successor_present_in_node_ids_or_raise_excp(possible_successors
         return possible_successor_set.pop()
 
 
-def get_all_split_successors(node_id: str, nodes_ids: list[str]) -> list[str]:
+def get_split_successors_index(nodes_ids: list[str]) -> dict[str, list[str]]:
+    """
+    Groups node identifiers that look like split successors by the identifier they continue,
+    e.g. "3a" and "3b1" are both stored under "3". Each node identifier is decomposed once, so looking up split
+    successors of any node is a single dictionary access.
+
+    :param nodes_ids: A list of existing node identifiers.
+    :return: A dictionary mapping the continued identifier to split successor identifiers, in nodes_ids order.
+    """
+    split_successors_index = {}
+    for elem in nodes_ids:
+        # "$" in regex_suffix_split_succ also matches before a trailing new line
+        base = elem[:-1] if elem.endswith('\n') else elem
+        base = base.rstrip('1')
+        if base and base[-1] in _prefix_end_chars:
+            split_successors_index.setdefault(base[:-1], []).append(elem)
+    return split_successors_index
+
+
+def get_all_split_successors(node_id: str,
+                             nodes_ids: list[str],
+                             split_successors_index: dict[str, list[str]] | None = None
+                             ) -> list[str]:
     """
     Identifies all possible successors of a node in the case of a split, based on a specific pattern.
 
     :param node_id: The identifier of the node as a string.
     :param nodes_ids: A list of existing node identifiers.
+    :param split_successors_index: Optional index built by get_split_successors_index from the same node
+                                   identifiers. If given, nodes_ids are not scanned.
     :return: A list of node identifiers that are split successors of the given node.
     """
-    result = re.match(regex_pa_trailing_number, node_id)
+    result = _parse_trailing_number(node_id)
     if not result:
         raise bpmn_exception.BpmnPythonError("Something wrong in program - look for " + node_id)
-    trailing_number = result.group(2)
-    prefix = result.group(1)
+    prefix, trailing_number = result
     new_trailing_number = str(int(trailing_number) + 1)
     next_node_id = prefix + new_trailing_number
 
-    pattern = regex_prefix_split_succ + next_node_id + regex_suffix_split_succ
+    if split_successors_index is not None:
+        return list(split_successors_index.get(next_node_id, ()))
+
+    # node ID is matched as a literal prefix, so IDs containing regex special characters are handled correctly
+    prefix_length = len(next_node_id)
     split_successors = []
     for elem in nodes_ids:
-        if re.match(pattern, elem):
+        if elem.startswith(next_node_id) and _RE_SUFFIX_SPLIT_SUCC.match(elem, prefix_length):
             split_successors.append(elem)
     return split_successors
 
 
-def is_there_sequence_continuation(node_id: str, nodes_ids: list[str]) -> bool:
+def is_there_sequence_continuation(node_id: str, nodes_ids: list[str] | set[str]) -> str | None:
     """
     Checks if there is a sequence continuation for the given node identifier.
 
     :param node_id: The identifier of the node as a string.
-    :param nodes_ids: A list of existing node identifiers.
-    :return: True if there is a sequence continuation, otherwise False.
+    :param nodes_ids: A list or a set of existing node identifiers.
+    :return: The identifier of the sequence successor if there is a sequence continuation, otherwise None.
     """
-    possible_seq_succ = get_possible_sequence_continuation_successor(node_id)
-    return is_any_possible_successor_present_in_node_ids(possible_seq_succ, nodes_ids)
+    for successor_node_id in get_possible_sequence_continuation_successor(node_id):
+        if successor_node_id in nodes_ids:
+            return successor_node_id
+    return None
 
 
-def is_there_split_continuation(node_id: str, nodes_ids: list[str]) -> bool:
+def is_there_split_continuation(node_id: str, nodes_ids: list[str] | set[str]) -> str | None:
     """
     Checks if there is a split continuation for the given node identifier.
 
     :param node_id: The identifier of the node as a string.
-    :param nodes_ids: A list of existing node identifiers.
-    :return: True if there is a split continuation, otherwise False.
+    :param nodes_ids: A list or a set of existing node identifiers.
+    :return: The identifier of the first found split successor if there is a split continuation, otherwise None.
     """
-    possible_split_succ = get_possible_split_continuation_successor(node_id)
-    return is_any_possible_successor_present_in_node_ids(possible_split_succ, nodes_ids)
+    for successor_node_id in get_possible_split_continuation_successor(node_id):
+        if successor_node_id in nodes_ids:
+            return successor_node_id
+    return None
 
 
-def is_there_merge_continuation(node_id: str, nodes_ids: list[str]) -> bool:
+def is_there_merge_continuation(node_id: str, nodes_ids: list[str] | set[str]) -> str | None:
     """
     Determines if there is a merge continuation for the given node identifier.
 
     :param node_id: The identifier of the node as a string.
-    :param nodes_ids: A list of existing node identifiers.
-    :return: True if there is a merge continuation, otherwise False.
-    """
-    possible_merge_succ = get_possible_merge_continuation_successors(node_id)
-    return is_any_possible_successor_present_in_node_ids(possible_merge_succ, nodes_ids)
+    :param nodes_ids: A list or a set of existing node identifiers.
+    :return: The identifier of the merge successor if there is a merge continuation, otherwise None.
+    :raises BpmnPythonError: If more than one merge successor is found.
+    """
+    merge_successors = {successor_node_id for successor_node_id in _merge_continuation_successors(node_id)
+                        if successor_node_id in nodes_ids}
+    if not merge_successors:
+        return None
+    if len(merge_successors) != 1:
+        raise bpmn_exception.BpmnPythonError("Some error in program - there should be exactly one found successor.")
+    return merge_successors.pop()
 
 
 def is_node_the_end_event(node_id: str, process_dict: dict[str, dict[str, str]]) -> bool:
@@ -283,7 +411,17 @@ def is_node_the_end_event(node_id: str, process_dict: dict[str, dict[str, str]])
     :param process_dict: A dictionary containing process information.
     :return: True if the node is an end event, otherwise False.
     """
-    return process_dict[node_id][consts.Consts.csv_terminated] == 'yes'
+    return process_dict[node_id][_CSV_TERMINATED] == 'yes'
+
+
+def get_end_event_ids(process_dict: dict[str, dict[str, str]]) -> set[str]:
+    """
+    Collects identifiers of all nodes marked as end events, scanning the terminated column once.
+
+    :param process_dict: A dictionary containing process information.
+    :return: A set of identifiers of end event nodes.
+    """
+    return {order for order, csv_line_dict in process_dict.items() if csv_line_dict[_CSV_TERMINATED] == 'yes'}
 
 
 def add_outgoing_flow(node_id: str, successor_node_id: str, bpmn_diagram: BpmnDiagramGraph):
@@ -318,8 +456,9 @@ def get_connection_condition_if_present(to_node_id: str, process_dict: dict[str,
     :param process_dict: A dictionary containing process information.
     :return: The connection condition as a string if present, otherwise None.
     """
-    if to_node_id in process_dict:
-        return process_dict[to_node_id].get(consts.Consts.csv_condition)
+    csv_line_dict = process_dict.get(to_node_id)
+    if csv_line_dict is not None:
+        return csv_line_dict.get(_CSV_CONDITION)
 
 
 def get_flow_id(from_node_id: str, to_node_id: str) -> str:
@@ -348,17 +487,34 @@ def add_edge(from_node_id: str,
     :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
     :param sequence_flows: A dictionary to store sequence flow information.
     """
-    condition = get_connection_condition_if_present(to_node_id, process_dict)
-    flow_id = get_flow_id(from_node_id, to_node_id)
-    flow = SequenceFlow(id=flow_id,
-                        name="",
-                        source_ref_id=from_node_id,
-                        target_ref_id=to_node_id,
-                        process_id=default_process_id)
-    sequence_flows[flow_id] = flow
+    _add_sequence_flow(get_flow_id(from_node_id, to_node_id), from_node_id, to_node_id, process_dict, sequence_flows)
 
-    if bool(condition):
-        flow.condition_expression = ConditionExpression(id=flow_id + "_cond", condition=condition)
+
+def _add_sequence_flow(flow_id: str,
+                       from_node_id: str,
+                       to_node_id: str,
+                       process_dict: dict[str, dict[str, str]],
+                       sequence_flows: dict[str, SequenceFlow]
+                       ):
+    """
+    Creates a sequence flow with given ID, including condition of the target node if present.
+
+    :param flow_id: The identifier of the sequence flow.
+    :param from_node_id: The identifier of the source node as a string.
+    :param to_node_id: The identifier of the target node as a string.
+    :param process_dict: A dictionary containing process information.
+    :param sequence_flows: A dictionary to store sequence flow information.
+    """
+    condition = get_connection_condition_if_present(to_node_id, process_dict)
+    condition_expression = None
+    if condition:
+        condition_expression = ConditionExpression(id=flow_id + "_cond", condition=condition)
+    sequence_flows[flow_id] = SequenceFlow(id=flow_id,
+                                           name="",
+                                           source_ref_id=from_node_id,
+                                           target_ref_id=to_node_id,
+                                           process_id=default_process_id,
+                                           condition_expression=condition_expression)
 
 
 def add_connection(from_node_id: str,
@@ -376,9 +532,11 @@ def add_connection(from_node_id: str,
     :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
     :param sequence_flows: A dictionary to store sequence flow information.
     """
-    add_outgoing_flow(from_node_id, to_node_id, bpmn_diagram)
-    add_incoming_flow(to_node_id, from_node_id, bpmn_diagram)
-    add_edge(from_node_id, to_node_id, process_dict, bpmn_diagram, sequence_flows)
+    flow_id = get_flow_id(from_node_id, to_node_id)
+    nodes = bpmn_diagram.nodes
+    nodes[from_node_id].outgoing.append(flow_id)
+    nodes[to_node_id].incoming.append(flow_id)
+    _add_sequence_flow(flow_id, from_node_id, to_node_id, process_dict, sequence_flows)
 
 
 def get_node_conditions(split_successors: list[str], process_dict: dict[str, dict[str, str]]):
@@ -389,10 +547,7 @@ def get_node_conditions(split_successors: list[str], process_dict: dict[str, dic
     :param process_dict: A dictionary containing process information.
     :return: A list of conditions for the split successors.
     """
-    conditions = []
-    for succ in split_successors:
-        conditions.append(process_dict[succ][consts.Consts.csv_condition].strip())
-    return conditions
+    return [process_dict[succ][_CSV_CONDITION] for succ in split_successors]
 
 
 def yes_no_conditions(node_conditions: list[str]) -> bool:
@@ -422,22 +577,25 @@ def no_conditions(node_conditions: list[str]) -> bool:
     :param node_conditions: A list of node conditions.
     :return: True if the conditions are empty or contain only empty strings, otherwise False.
     """
-    for node in node_conditions:
-        if bool(node):
-            return False
-    return True
+    return not any(node_conditions)
 
 
-def get_gateway_type(node_id_to_add_after: str, nodes_ids: list[str], process_dict: dict[str, dict[str, str]]) -> NodeType:
+def get_gateway_type(node_id_to_add_after: str,
+                     nodes_ids: list[str],
+                     process_dict: dict[str, dict[str, str]],
+                     split_successors: list[str] | None = None
+                     ) -> NodeType:
     """
     Determines the type of gateway to be added after the given node based on its successors' conditions.
 
     :param node_id_to_add_after: The identifier of the node to add the gateway after.
     :param nodes_ids: A list of existing node identifiers.
     :param process_dict: A dictionary containing process information.
+    :param split_successors: Optional, already computed split successors of the given node.
     :return: A string representing the gateway type (e.g., exclusive, inclusive, parallel).
     """
-    split_successors = get_all_split_successors(node_id_to_add_after, nodes_ids)
+    if split_successors is None:
+        split_successors = get_all_split_successors(node_id_to_add_after, nodes_ids)
     successors_conditions = get_node_conditions(split_successors, process_dict)
     if len(split_successors) == 2:
         if yes_no_conditions(successors_conditions) or sth_else_conditions(successors_conditions):
@@ -450,7 +608,8 @@ def get_gateway_type(node_id_to_add_after: str, nodes_ids: list[str], process_di
 def add_split_gateway(node_id_to_add_after: str,
                       nodes_ids: list[str],
                       process_dict: dict[str, dict[str, str]],
-                      bpmn_diagram: BpmnDiagramGraph
+                      bpmn_diagram: BpmnDiagramGraph,
+                      split_successors: list[str] | None = None
                       ) -> str:
     """
     Adds a split gateway after the given node in the BPMN diagram.
@@ -459,11 +618,12 @@ def add_split_gateway(node_id_to_add_after: str,
     :param nodes_ids: A list of existing node identifiers.
     :param process_dict: A dictionary containing process information.
     :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
+    :param split_successors: Optional, already computed split successors of the given node.
     :return: The identifier of the added split gateway.
     """
     split_gateway_id = node_id_to_add_after + "_split"
     process_id = default_process_id
-    gateway_type = get_gateway_type(node_id_to_add_after, nodes_ids, process_dict)
+    gateway_type = get_gateway_type(node_id_to_add_after, nodes_ids, process_dict, split_successors)
     activity = ""
     add_node_info_to_diagram_graph(split_gateway_id, gateway_type, activity, process_id, bpmn_diagram)
     return split_gateway_id
@@ -477,18 +637,16 @@ def get_merge_node_type(merge_successor_id: str, bpmn_diagram: BpmnDiagramGraph)
     :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
     :return: A string representing the merge node type (e.g., inclusive, exclusive).
     """
-    result = re.match(regex_pa_trailing_number, merge_successor_id)
+    result = _parse_trailing_number(merge_successor_id)
     if result:
-        trailing_number = result.group(2)
+        prefix, trailing_number = result
         prev_prev_number = int(trailing_number) - 2
         if prev_prev_number < 0:
             raise bpmn_exception.BpmnPythonError("Something wrong in csv file syntax - look for " + merge_successor_id)
-        prefix = result.group(1)
         split_node_id = prefix + str(prev_prev_number) + "_split"
-        if split_node_id in bpmn_diagram.nodes:
-            node_type = bpmn_diagram.nodes[split_node_id].node_type
-            if node_type != NodeType.BASE:
-                return node_type
+        split_node = bpmn_diagram.nodes.get(split_node_id)
+        if split_node is not None and split_node.node_type != NodeType.BASE:
+            return split_node.node_type
         return NodeType.INCLUSIVE
 
 
@@ -513,44 +671,73 @@ def add_merge_gateway_if_not_exists(merge_successor_id: str, bpmn_diagram: BpmnD
         return merge_gateway_id, just_created
 
 
+def _classify_all(nodes_ids: list[str], end_event_ids: set[str]) -> list[tuple[int, str, str]]:
+    """
+    Classifies every node by the kind of continuation that follows it in the process.
+    Classification depends only on node IDs, so it is done in a single pass before the graph is modified.
+
+    :param nodes_ids: A list of existing node identifiers.
+    :param end_event_ids: A set of identifiers of nodes marked as end events.
+    :return: A list of (kind, node ID, successor ID) tuples. Successor ID is an empty string for end events
+             and splits.
+    :raises BpmnPythonError: If a node has no valid continuation.
+    """
+    nodes_ids_set = set(nodes_ids)
+    classified = []
+    for node_id in nodes_ids:
+        node_id = str(node_id)
+        if node_id in end_event_ids:
+            classified.append((_END_EVENT, node_id, ""))
+            continue
+        successor_node_id = is_there_sequence_continuation(node_id, nodes_ids_set)
+        if successor_node_id is not None:
+            classified.append((_SEQUENCE_CONTINUATION, node_id, successor_node_id))
+        elif is_there_split_continuation(node_id, nodes_ids_set) is not None:
+            classified.append((_SPLIT_CONTINUATION, node_id, ""))
+        else:
+            successor_node_id = is_there_merge_continuation(node_id, nodes_ids_set)
+            if successor_node_id is None:
+                raise bpmn_exception.BpmnPythonError("Something wrong in csv file syntax - look for " + node_id)
+            classified.append((_MERGE_CONTINUATION, node_id, successor_node_id))
+    return classified
+
+
 def fill_graph_connections(process_dict: dict[str, dict[str, str]],
                            bpmn_diagram: BpmnDiagramGraph,
                            sequence_flows: dict[str, SequenceFlow]
-                           ):
+                           ) -> list[str]:
     """
     Fills the BPMN diagram with connections based on the process dictionary.
 
     :param process_dict: A dictionary containing process information.
     :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
     :param sequence_flows: A dictionary to store sequence flow information.
+    :return: A list of identifiers of the gateways added to the diagram, in order of creation.
     """
+    gateway_ids = []
     nodes_ids = list(bpmn_diagram.nodes.keys())
-    nodes_ids_to_process = copy.deepcopy(nodes_ids)
-    while len(nodes_ids_to_process) > 0:
-        node_id = str(nodes_ids_to_process.pop(0))
-        if is_node_the_end_event(node_id, process_dict):
-            pass
-        elif is_there_sequence_continuation(node_id, nodes_ids):
-            possible_sequence_successors = get_possible_sequence_continuation_successor(node_id)
-            successor_node_id = get_possible_successor_present_in_node_ids_or_raise_excp(possible_sequence_successors,
-                                                                                         nodes_ids)
+    end_event_ids = get_end_event_ids(process_dict)
+    split_successors_index = get_split_successors_index(nodes_ids)
+    for kind, node_id, successor_node_id in _classify_all(nodes_ids, end_event_ids):
+        if kind == _SEQUENCE_CONTINUATION:
             add_connection(node_id, successor_node_id, process_dict, bpmn_diagram, sequence_flows)
-        elif is_there_split_continuation(node_id, nodes_ids):
-            split_gateway_id = add_split_gateway(node_id, nodes_ids, process_dict, bpmn_diagram)
+        elif kind == _SPLIT_CONTINUATION:
+            split_successors = get_all_split_successors(node_id, nodes_ids, split_successors_index)
+            split_gateway_id = add_split_gateway(node_id, nodes_ids, process_dict, bpmn_diagram, split_successors)
+            gateway_ids.append(split_gateway_id)
             add_connection(node_id, split_gateway_id, process_dict, bpmn_diagram, sequence_flows)
-            for successor_node_id in get_all_split_successors(node_id, nodes_ids):
-                add_connection(split_gateway_id, successor_node_id, process_dict, bpmn_diagram, sequence_flows)
-            pass
-        elif is_there_merge_continuation(node_id, nodes_ids):
-            possible_merge_successors = get_possible_merge_continuation_successors(node_id)
-            merge_successor_id = get_possible_successor_present_in_node_ids_or_raise_excp(possible_merge_successors,
-                                                                                          nodes_ids)
-            merge_gateway_id, just_created = add_merge_gateway_if_not_exists(merge_successor_id, bpmn_diagram)
+            bpmn_diagram.nodes[split_gateway_id].outgoing.extend(
+                get_flow_id(split_gateway_id, split_successor_id) for split_successor_id in split_successors)
+            for split_successor_id in split_successors:
+                add_incoming_flow(split_successor_id, split_gateway_id, bpmn_diagram)
+                add_edge(split_gateway_id, split_successor_id, process_dict, bpmn_diagram, sequence_flows)
+        elif kind == _MERGE_CONTINUATION:
+            merge_gateway_id, just_created = add_merge_gateway_if_not_exists(successor_node_id, bpmn_diagram)
             if just_created:
-                add_connection(merge_gateway_id, merge_successor_id, process_dict, bpmn_diagram, sequence_flows)
+                gateway_ids.append(merge_gateway_id)
+                add_connection(merge_gateway_id, successor_node_id, process_dict, bpmn_diagram, sequence_flows)
             add_connection(node_id, merge_gateway_id, process_dict, bpmn_diagram, sequence_flows)
-        else:
-            raise bpmn_exception.BpmnPythonError("Something wrong in csv file syntax - look for " + node_id)
+    return gateway_ids
 
 
 def remove_outgoing_connection(base_node: str,
@@ -565,9 +752,10 @@ def remove_outgoing_connection(base_node: str,
     :param sequence_flows: A dictionary to store sequence flow information.
     :return: The identifier of the neighbor node that was connected to the base node.
     """
-    outgoing_flow_id = bpmn_diagram.nodes[base_node].outgoing[0]
+    nodes = bpmn_diagram.nodes
+    outgoing_flow_id = nodes[base_node].outgoing[0]
     neighbour_node = sequence_flows[outgoing_flow_id].target_ref_id
-    bpmn_diagram.nodes[neighbour_node].incoming.remove(outgoing_flow_id)
+    nodes[neighbour_node].incoming.remove(outgoing_flow_id)
     del sequence_flows[outgoing_flow_id]
     return neighbour_node
 
@@ -583,9 +771,10 @@ def remove_incoming_connection(base_node: str,
     :param sequence_flows: A dictionary to store sequence flow information.
     :return: The identifier of the neighbor node that was connected to the base node.
     """
-    incoming_flow_id = bpmn_diagram.nodes[base_node].incoming[0]
+    nodes = bpmn_diagram.nodes
+    incoming_flow_id = nodes[base_node].incoming[0]
     neighbour_node = sequence_flows[incoming_flow_id].source_ref_id
-    bpmn_diagram.nodes[neighbour_node].outgoing.remove(incoming_flow_id)
+    nodes[neighbour_node].outgoing.remove(incoming_flow_id)
     del sequence_flows[incoming_flow_id]
     return neighbour_node
 
@@ -612,23 +801,120 @@ def remove_node(node_id_to_remove: str,
     return new_source_node, new_target_node
 
 
+def is_gateway(node: FlowNode) -> bool:
+    """
+    Checks if the given node is one of the gateways created by CSV import.
+
+    :param node: A flow node of the BPMN diagram.
+    :return: True if the node is an inclusive, exclusive or parallel gateway, otherwise False.
+    """
+    return node.node_type in _GATEWAY_TYPES
+
+
+def is_unnecessary_gateway(node: FlowNode) -> bool:
+    """
+    Checks if the given node is a gateway that neither splits nor merges flows.
+
+    :param node: A flow node of the BPMN diagram.
+    :return: True if the node is a gateway with less than two incoming and less than two outgoing flows.
+    """
+    return is_gateway(node) and len(node.incoming) < 2 and len(node.outgoing) < 2
+
+
+def _rewire_through(node_id: str,
+                    new_target_node_id: str | None,
+                    process_dict: dict[str, dict[str, str]],
+                    bpmn_diagram: BpmnDiagramGraph,
+                    sequence_flows: dict[str, SequenceFlow]
+                    ):
+    """
+    Removes a node with a single incoming and a single outgoing flow and connects its predecessor to the new target.
+    Does the same as remove_node followed by add_connection, with each incident flow looked up only once.
+
+    :param node_id: The identifier of the node to remove.
+    :param new_target_node_id: The identifier of the node the predecessor is connected to. If None, the predecessor
+                               is connected to the successor of the removed node.
+    :param process_dict: A dictionary containing process information.
+    :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
+    :param sequence_flows: A dictionary to store sequence flow information.
+    """
+    nodes = bpmn_diagram.nodes
+    node = nodes[node_id]
+    incoming_flow_id = node.incoming[0]
+    source_node_id = sequence_flows.pop(incoming_flow_id).source_ref_id
+    nodes[source_node_id].outgoing.remove(incoming_flow_id)
+    outgoing_flow_id = node.outgoing[0]
+    target_node_id = sequence_flows.pop(outgoing_flow_id).target_ref_id
+    nodes[target_node_id].incoming.remove(outgoing_flow_id)
+    del nodes[node_id]
+    process_dict.pop(node_id, None)
+    if new_target_node_id is None:
+        new_target_node_id = target_node_id
+    add_connection(source_node_id, new_target_node_id, process_dict, bpmn_diagram, sequence_flows)
+
+
 def remove_unnecessary_merge_gateways(process_dict: dict[str, dict[str, str]],
                                       bpmn_diagram: BpmnDiagramGraph,
-                                      sequence_flows: dict[str, SequenceFlow]
+                                      sequence_flows: dict[str, SequenceFlow],
+                                      gateway_ids: list[str] | None = None
                                       ):
     """
     Removes unnecessary merge gateways from the BPMN diagram.
 
+    :param process_dict: A dictionary containing process information.
+    :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
+    :param sequence_flows: A dictionary to store sequence flow information.
+    :param gateway_ids: Optional list of identifiers of the gateways in the diagram, as returned by
+                        fill_graph_connections. If not given, all diagram nodes are checked.
+    """
+    if gateway_ids is None:
+        candidates = bpmn_diagram.get_nodes()
+    else:
+        nodes = bpmn_diagram.nodes
+        candidates = [nodes[gateway_id] for gateway_id in gateway_ids if gateway_id in nodes]
+    for node in candidates:
+        if is_unnecessary_gateway(node):
+            _rewire_through(node.id, None, process_dict, bpmn_diagram, sequence_flows)
+
+
+def get_second_token(activity: str) -> str:
+    """
+    Returns the second white space separated token of an activity, e.g. target node ID of a "goto" activity.
+    Splitting stops after the second token, so the rest of the activity text is not tokenized.
+
+    :param activity: The activity string.
+    :return: The second token of the activity.
+    """
+    return activity.split(None, 2)[1]
+
+
+def is_goto_activity(activity: str) -> bool:
+    """
+    Checks if the given activity is a "goto" activity.
+
+    :param activity: The activity string.
+    :return: True if the activity starts with "goto" (case insensitive), otherwise False.
+    """
+    # only the prefix is lowered, activities are free text and may be long
+    return activity[:4].lower() == "goto"
+
+
+def remove_goto_node(order: str,
+                     csv_line_dict: dict[str, str],
+                     process_dict: dict[str, dict[str, str]],
+                     bpmn_diagram: BpmnDiagramGraph,
+                     sequence_flows: dict[str, SequenceFlow]
+                     ):
+    """
+    Removes a single "goto" node and connects its predecessor directly to the "goto" target.
+
+    :param order: The identifier of the "goto" node.
+    :param csv_line_dict: A dictionary containing attributes of the "goto" node from the CSV file.
     :param process_dict: A dictionary containing process information.
     :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
     :param sequence_flows: A dictionary to store sequence flow information.
     """
-    for node in bpmn_diagram.get_nodes():
-        gateway_type = node.node_type
-        if gateway_type in [NodeType.INCLUSIVE, NodeType.EXCLUSIVE, NodeType.PARALLEL]:
-            if len(node.incoming) < 2 and len(node.outgoing) < 2:
-                new_source_node, new_target_node = remove_node(node.id, process_dict, bpmn_diagram, sequence_flows)
-                add_connection(new_source_node, new_target_node, process_dict, bpmn_diagram, sequence_flows)
+    _rewire_through(order, get_second_token(csv_line_dict[_CSV_ACTIVITY]), process_dict, bpmn_diagram, sequence_flows)
 
 
 def remove_goto_nodes(process_dict: dict[str, dict[str, str]],
@@ -642,11 +928,55 @@ def remove_goto_nodes(process_dict: dict[str, dict[str, str]],
     :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
     :param sequence_flows: A dictionary to store sequence flow information.
     """
-    for order, csv_line_dict in copy.deepcopy(process_dict).items():
-        if csv_line_dict[consts.Consts.csv_activity].lower().startswith("goto"):
-            source_node, _ = remove_node(order, process_dict, bpmn_diagram, sequence_flows)
-            target_node = csv_line_dict[consts.Consts.csv_activity].strip().split()[1]
-            add_connection(source_node, target_node, process_dict, bpmn_diagram, sequence_flows)
+    # rows are removed from process_dict while iterating, a shallow snapshot of the items is enough
+    for order, csv_line_dict in list(process_dict.items()):
+        if is_goto_activity(csv_line_dict[_CSV_ACTIVITY]):
+            remove_goto_node(order, csv_line_dict, process_dict, bpmn_diagram, sequence_flows)
+
+
+def remove_goto_nodes_and_merge_gateways(process_dict: dict[str, dict[str, str]],
+                                         bpmn_diagram: BpmnDiagramGraph,
+                                         sequence_flows: dict[str, SequenceFlow],
+                                         gateway_ids: list[str] | None = None
+                                         ):
+    """
+    Removes "goto" nodes and then unnecessary merge gateways.
+    Gateways are only checked once all "goto" nodes are removed, because removing a "goto" node may drop
+    an incoming flow of a merge gateway.
+
+    :param process_dict: A dictionary containing process information.
+    :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
+    :param sequence_flows: A dictionary to store sequence flow information.
+    :param gateway_ids: Optional list of identifiers of the gateways in the diagram, as returned by
+                        fill_graph_connections. If not given, all diagram nodes are checked.
+    """
+    remove_goto_nodes(process_dict, bpmn_diagram, sequence_flows)
+    remove_unnecessary_merge_gateways(process_dict, bpmn_diagram, sequence_flows, gateway_ids)
+
+
+def iter_csv_rows(filepath: str) -> Iterator[tuple[str, dict[str, str]]]:
+    """
+    Lazily reads rows of a process CSV file. The first column holds node orders, remaining columns are returned
+    as a row dictionary. Orders and conditions are stripped of leading and trailing white spaces while reading,
+    missing trailing cells are filled with empty strings and blank lines are skipped.
+
+    :param filepath: The path to the CSV file.
+    :return: An iterator over (order, row dictionary) pairs, in file order.
+    """
+    with open(filepath, newline='', encoding='utf-8-sig') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader, [])
+        columns = [sys.intern(column) for column in header[1:]]
+        for row in reader:
+            if not row:
+                continue
+            # short cells (orders, flags, conditions) repeat a lot and are compared often, so they are interned
+            values = [sys.intern(cell) if len(cell) < _INTERN_MAX_LENGTH else cell for cell in row[1:]]
+            csv_line_dict = dict(zip(columns, values + [""] * (len(header) - len(row))))
+            condition = csv_line_dict.get(_CSV_CONDITION)
+            if condition is not None:
+                csv_line_dict[_CSV_CONDITION] = sys.intern(condition.strip())
+            yield sys.intern(row[0].strip()), csv_line_dict
 
 
 class BpmnDiagramGraphCSVImport(object):
@@ -674,8 +1004,8 @@ class BpmnDiagramGraphCSVImport(object):
         BpmnDiagramGraphCSVImport.populate_process_elements_dict(process_elements_dict)
         BpmnDiagramGraphCSVImport.populate_plane_elements_dict(plane_attributes)
 
-        BpmnDiagramGraphCSVImport.import_nodes(process_dict, bpmn_diagram, sequence_flows)
-        BpmnDiagramGraphCSVImport.representation_adjustment(process_dict, bpmn_diagram, sequence_flows)
+        gateway_ids = BpmnDiagramGraphCSVImport.import_nodes(process_dict, bpmn_diagram, sequence_flows)
+        BpmnDiagramGraphCSVImport.representation_adjustment(process_dict, bpmn_diagram, sequence_flows, gateway_ids)
 
     @staticmethod
     def import_csv_file_as_dict(filepath: str) -> dict[str, dict[str, str]]:
@@ -685,35 +1015,37 @@ class BpmnDiagramGraphCSVImport(object):
         :param filepath: The path to the CSV file.
         :return: A dictionary representation of the CSV file.
         """
-        process_dict = pd.read_csv(filepath, index_col=0).fillna("").to_dict('index')
-        remove_white_spaces_in_orders(process_dict)
-        return process_dict
+        return dict(iter_csv_rows(filepath))
 
     @staticmethod
-    def get_given_task_as_dict(csv_df, order_val):
+    def get_given_task_as_dict(process_dict: dict[str, dict[str, str]], order_val: str) -> dict[str, str]:
         """
-        Retrieves a specific task from the CSV DataFrame as a dictionary.
+        Retrieves a specific task from the process dictionary as a dictionary, including its order.
 
-        :param csv_df: The CSV DataFrame.
+        :param process_dict: A dictionary containing process information.
         :param order_val: The order value of the task to retrieve.
         :return: A dictionary representation of the task.
         """
-        return csv_df.loc[csv_df[consts.Consts.csv_order] == order_val].iloc[0].to_dict()
+        csv_line_dict = process_dict.get(order_val)
+        if csv_line_dict is None:
+            raise bpmn_exception.BpmnPythonError("There is no task with order " + str(order_val))
+        return {_CSV_ORDER: order_val, **csv_line_dict}
 
     @staticmethod
     def import_nodes(process_dict: dict[str, dict[str, str]],
                      bpmn_diagram: BpmnDiagramGraph,
                      sequence_flows: dict[str, SequenceFlow]
-                     ):
+                     ) -> list[str]:
         """
         Imports nodes into the BPMN diagram based on the process dictionary.
 
         :param process_dict: A dictionary containing process information.
         :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
         :param sequence_flows: A dictionary to store sequence flow information.
+        :return: A list of identifiers of the gateways added to the diagram.
         """
         import_nodes_info(process_dict, bpmn_diagram)
-        fill_graph_connections(process_dict, bpmn_diagram, sequence_flows)
+        return fill_graph_connections(process_dict, bpmn_diagram, sequence_flows)
 
     @staticmethod
     def populate_diagram_elements_dict(diagram_elements_dict: dict[str, str]):
@@ -722,8 +1054,7 @@ class BpmnDiagramGraphCSVImport(object):
 
         :param diagram_elements_dict: The dictionary to populate.
         """
-        diagram_elements_dict[consts.Consts.id] = "diagram1"
-        diagram_elements_dict[consts.Consts.name] = "diagram_name"
+        diagram_elements_dict.update({consts.Consts.id: "diagram1", consts.Consts.name: "diagram_name"})
 
     @staticmethod
     def populate_process_elements_dict(process_elements_dict: dict[str, Process]):
@@ -744,13 +1075,13 @@ class BpmnDiagramGraphCSVImport(object):
 
         :param plane_elements_dict: The dictionary to populate.
         """
-        plane_elements_dict[consts.Consts.id] = default_plane_id
-        plane_elements_dict[consts.Consts.bpmn_element] = default_process_id
+        plane_elements_dict.update({consts.Consts.id: default_plane_id, consts.Consts.bpmn_element: default_process_id})
 
     @staticmethod
     def representation_adjustment(process_dict: dict[str, dict[str, str]],
                                   bpmn_diagram: BpmnDiagramGraph,
-                                  sequence_flows: dict[str, SequenceFlow]
+                                  sequence_flows: dict[str, SequenceFlow],
+                                  gateway_ids: list[str] | None = None
                                   ):
         """
         Adjusts the representation of the BPMN diagram.
@@ -758,6 +1089,6 @@ class BpmnDiagramGraphCSVImport(object):
         :param process_dict: A dictionary containing process information.
         :param bpmn_diagram: An instance of the BPMNDiagramGraph class representing the BPMN diagram.
         :param sequence_flows: A dictionary to store sequence flow information.
+        :param gateway_ids: Optional list of identifiers of the gateways in the diagram.
         """
-        remove_goto_nodes(process_dict, bpmn_diagram, sequence_flows)
-        remove_unnecessary_merge_gateways(process_dict, bpmn_diagram, sequence_flows)
+        remove_goto_nodes_and_merge_gateways(process_dict, bpmn_diagram, sequence_flows, gateway_ids)
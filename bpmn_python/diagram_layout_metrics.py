@@ -2,12 +2,26 @@
 """
 Collection of different metrics used to compare diagram layout quality
 """
-import copy
-import bpmn_python.bpmn_python_consts as consts
+from typing import Callable, NamedTuple
+
 from bpmn_python.bpmn_diagram_rep import BpmnDiagramGraph
 from bpmn_python.graph.classes.flow_node import FlowNode, NodeType
 from bpmn_python.graph.classes.sequence_flow import SequenceFlow
 
+# node types counted by compute_longest_path_tasks
+_TASK_NODE_TYPES = frozenset({NodeType.TASK, NodeType.SUB_PROCESS})
+
+
+class Segment(NamedTuple):
+    """
+    Straight part of a flow between two consecutive waypoints.
+    Being a tuple, a segment can be sliced into its source point (segment[:2]) and target point (segment[2:]).
+    """
+    sx: float
+    sy: float
+    tx: float
+    ty: float
+
 
 def count_crossing_points(bpmn_graph: BpmnDiagramGraph) -> int:
     """
@@ -19,11 +33,32 @@ def count_crossing_points(bpmn_graph: BpmnDiagramGraph) -> int:
     flows = [flow for _, _, flow in bpmn_graph.get_flows()]
     segments = get_flows_segments(flows)
 
+    # every distinct point gets an integer ID, so segments sharing an endpoint are found without comparing floats
+    point_ids = {}
+    # sweep over the x axis - two segments can only cross if their x ranges overlap, so each segment is
+    # compared only with segments starting before it ends
+    sweep = []
+    for segment in segments:
+        source_id = point_ids.setdefault((segment.sx, segment.sy), len(point_ids))
+        target_id = point_ids.setdefault((segment.tx, segment.ty), len(point_ids))
+        sweep.append((min(segment.sx, segment.tx), max(segment.sx, segment.tx),
+                      min(segment.sy, segment.ty), max(segment.sy, segment.ty), source_id, target_id, segment))
+    sweep.sort(key=lambda item: item[0])
+
     crossing_point_num = 0
-    while segments:
-        segment_one = segments.pop()
-        for segment_two in segments:
-            if segments_common_points(segment_one, segment_two) is False and do_intersect(segment_one, segment_two):
+    for index, (_, max_x, min_y_one, max_y_one, source_id_one, target_id_one, segment_one) in enumerate(sweep):
+        for other_index in range(index + 1, len(sweep)):
+            min_x, _, min_y_two, max_y_two, source_id_two, target_id_two, segment_two = sweep[other_index]
+            if min_x > max_x:
+                break
+            # segments with disjoint y ranges cannot cross either
+            if max_y_one < min_y_two or max_y_two < min_y_one:
+                continue
+            # segments with a common point are not counted
+            if source_id_one == source_id_two or source_id_one == target_id_two \
+                    or target_id_one == source_id_two or target_id_one == target_id_two:
+                continue
+            if do_intersect(segment_one, segment_two):
                 crossing_point_num += 1
 
     return crossing_point_num
@@ -38,8 +73,11 @@ def compute_determinant(p1: tuple[float, float], p2: tuple[float, float], p3: tu
     :param p3: Third point as a tuple (x, y).
     :return: The determinant value.
     """
-    det = float(p1[0]) * float(p2[1]) + float(p2[0]) * float(p3[1]) + float(p3[0]) * float(p1[1])
-    det -= float(p1[0]) * float(p3[1]) + float(p2[0]) * float(p1[1]) + float(p3[0]) * float(p2[1])
+    x1, y1 = float(p1[0]), float(p1[1])
+    x2, y2 = float(p2[0]), float(p2[1])
+    x3, y3 = float(p3[0]), float(p3[1])
+    det = x1 * y2 + x2 * y3 + x3 * y1
+    det -= x1 * y3 + x2 * y1 + x3 * y2
     return det
 
 
@@ -53,29 +91,27 @@ def check_integer_sign(value: float | int) -> bool:
     return value >= 0
 
 
-def get_flows_segments(flows: list[SequenceFlow]) -> list[dict[str, dict[str, float]]]:
+def get_flows_segments(flows: list[SequenceFlow]) -> list[Segment]:
     """
     Extracts flow segments from the given flows.
 
     :param flows: A list of flows from the BPMN graph.
-    :return: A list of flow segments with source and target points.
+    :return: A list of flow segments.
     """
-    source_param_name = "source"
-    target_param_name = "target"
-
     segments = []
     for flow in flows:
-        waypoints = copy.deepcopy(flow.waypoints)
-        source = waypoints.pop(0)
-        while len(waypoints) > 0:
-            target = waypoints.pop(0)
-            segments.append({source_param_name: {consts.Consts.x: float(source[0]), consts.Consts.y: float(source[1])},
-                             target_param_name: {consts.Consts.x: float(target[0]), consts.Consts.y: float(target[1])}})
-            source = target
+        # single pass over the waypoints, so coordinates shared by two consecutive segments are converted once
+        source_x = source_y = None
+        for waypoint in flow.waypoints:
+            target_x = float(waypoint[0])
+            target_y = float(waypoint[1])
+            if source_x is not None:
+                segments.append(Segment(source_x, source_y, target_x, target_y))
+            source_x, source_y = target_x, target_y
     return segments
 
 
-def segments_common_points(segment_one: dict[str, dict[str, float]], segment_two: dict[str, dict[str, float]]) -> bool:
+def segments_common_points(segment_one: Segment, segment_two: Segment) -> bool:
     """
     Checks if two segments share any common points.
 
@@ -83,26 +119,26 @@ def segments_common_points(segment_one: dict[str, dict[str, float]], segment_two
     :param segment_two: The second segment.
     :return: True if the segments share common points, False otherwise.
     """
-    source_param = "source"
-    target_param = "target"
-    return points_are_equal(segment_one[source_param], segment_two[source_param]) \
-        or points_are_equal(segment_one[source_param], segment_two[target_param]) \
-        or points_are_equal(segment_one[target_param], segment_two[source_param]) \
-        or points_are_equal(segment_one[target_param], segment_two[target_param])
+    source_one, target_one = segment_one[:2], segment_one[2:]
+    source_two, target_two = segment_two[:2], segment_two[2:]
+    return points_are_equal(source_one, source_two) \
+        or points_are_equal(source_one, target_two) \
+        or points_are_equal(target_one, source_two) \
+        or points_are_equal(target_one, target_two)
 
 
-def points_are_equal(p1: dict[str, float], p2: dict[str, float]) -> bool:
+def points_are_equal(p1: tuple[float, float], p2: tuple[float, float]) -> bool:
     """
     Checks if two points are equal.
 
-    :param p1: The first point as a dictionary with x and y coordinates.
-    :param p2: The second point as a dictionary with x and y coordinates.
+    :param p1: The first point as a tuple (x, y).
+    :param p2: The second point as a tuple (x, y).
     :return: True if the points are equal, False otherwise.
     """
-    return p1[consts.Consts.x] == p2[consts.Consts.x] and p1[consts.Consts.y] == p2[consts.Consts.y]
+    return p1[0] == p2[0] and p1[1] == p2[1]
 
 
-def do_intersect(segment_one: dict[str, dict[str, float]], segment_two: dict[str, dict[str, float]]) -> bool:
+def do_intersect(segment_one: Segment, segment_two: Segment) -> bool:
     """
     Determines if two segments intersect.
 
@@ -110,55 +146,58 @@ def do_intersect(segment_one: dict[str, dict[str, float]], segment_two: dict[str
     :param segment_two: The second segment.
     :return: True if the segments intersect, False otherwise.
     """
-    source_param = "source"
-    target_param = "target"
-    # Find the four orientations needed for general and special cases
-    o1 = orientation(segment_one[source_param], segment_one[target_param], segment_two[source_param])
-    o2 = orientation(segment_one[source_param], segment_one[target_param], segment_two[target_param])
-    o3 = orientation(segment_two[source_param], segment_two[target_param], segment_one[source_param])
-    o4 = orientation(segment_two[source_param], segment_two[target_param], segment_one[target_param])
+    ax, ay, bx, by = segment_one
+    cx, cy, dx, dy = segment_two
+    # Find the four orientations needed for general and special cases. The arithmetic is the same as in
+    # orientation, inlined so that differences shared by orientations against the same segment are computed once
+    abx = bx - ax
+    aby = by - ay
+    cdx = dx - cx
+    cdy = dy - cy
+    val1 = aby * (cx - bx) - abx * (cy - by)
+    val2 = aby * (dx - bx) - abx * (dy - by)
+    val3 = cdy * (ax - dx) - cdx * (ay - dy)
+    val4 = cdy * (bx - dx) - cdx * (by - dy)
+    o1 = (val1 > 0) + 2 * (val1 < 0)
+    o2 = (val2 > 0) + 2 * (val2 < 0)
+    o3 = (val3 > 0) + 2 * (val3 < 0)
+    o4 = (val4 > 0) + 2 * (val4 < 0)
 
     if o1 != o2 and o3 != o4:
         return True
 
     # Special Cases
-    if o1 == 0 and lies_on_segment(segment_one[source_param], segment_one[target_param], segment_two[source_param]):
+    if o1 == 0 and lies_on_segment((ax, ay), (bx, by), (cx, cy)):
         return True
 
-    if o2 == 0 and lies_on_segment(segment_one[source_param], segment_one[target_param], segment_two[target_param]):
+    if o2 == 0 and lies_on_segment((ax, ay), (bx, by), (dx, dy)):
         return True
 
-    if o3 == 0 and lies_on_segment(segment_two[source_param], segment_two[target_param], segment_one[source_param]):
+    if o3 == 0 and lies_on_segment((cx, cy), (dx, dy), (ax, ay)):
         return True
 
-    if o4 == 0 and lies_on_segment(segment_two[source_param], segment_two[target_param], segment_one[target_param]):
+    if o4 == 0 and lies_on_segment((cx, cy), (dx, dy), (bx, by)):
         return True
 
     # Neither of special cases
     return False
 
 
-def orientation(p1: dict[str, float], p2: dict[str, float], p3: dict[str, float]) -> int:
+def orientation(p1: tuple[float, float], p2: tuple[float, float], p3: tuple[float, float]) -> int:
     """
     Determines the orientation of three points.
 
-    :param p1: First point as a dictionary with x and y coordinates.
-    :param p2: Second point as a dictionary with x and y coordinates.
-    :param p3: Third point as a dictionary with x and y coordinates.
+    :param p1: First point as a tuple (x, y).
+    :param p2: Second point as a tuple (x, y).
+    :param p3: Third point as a tuple (x, y).
     :return: 0 if collinear, 1 if clockwise, 2 if counterclockwise.
     """
-    val = (p2[consts.Consts.y] - p1[consts.Consts.y]) * (p3[consts.Consts.x] - p2[consts.Consts.x]) \
-          - (p2[consts.Consts.x] - p1[consts.Consts.x]) * (p3[consts.Consts.y] - p2[consts.Consts.y])
-
-    if val == 0:
-        return 0  # collinear
-    elif val > 0:
-        return 1  # clockwise
-    else:
-        return 2  # counterclockwise
+    val = (p2[1] - p1[1]) * (p3[0] - p2[0]) - (p2[0] - p1[0]) * (p3[1] - p2[1])
+    # 0 if collinear, 1 if clockwise, 2 if counterclockwise, computed without branching on the sign
+    return (val > 0) + 2 * (val < 0)
 
 
-def lies_on_segment(p1: dict[str, float], p2: dict[str, float], p3: dict[str, float]) -> bool:
+def lies_on_segment(p1: tuple[float, float], p2: tuple[float, float], p3: tuple[float, float]) -> bool:
     """
     Checks if a point lies on a segment defined by two other points.
 
@@ -167,10 +206,8 @@ def lies_on_segment(p1: dict[str, float], p2: dict[str, float], p3: dict[str, fl
     :param p3: The point to check.
     :return: True if the point lies on the segment, False otherwise.
     """
-    return min(p1[consts.Consts.x], p2[consts.Consts.x]) <= p3[consts.Consts.x] \
-        <= max(p1[consts.Consts.x], p2[consts.Consts.x]) \
-        and min(p1[consts.Consts.y], p2[consts.Consts.y]) <= p3[consts.Consts.y] \
-        <= max(p1[consts.Consts.y], p2[consts.Consts.y])
+    return min(p1[0], p2[0]) <= p3[0] <= max(p1[0], p2[0]) \
+        and min(p1[1], p2[1]) <= p3[1] <= max(p1[1], p2[1])
 
 
 def count_segments(bpmn_graph: BpmnDiagramGraph) -> int:
@@ -192,47 +229,81 @@ def compute_longest_path(bpmn_graph: BpmnDiagramGraph) -> tuple[list[FlowNode],
     :param bpmn_graph: The BPMN graph object.
     :return: A tuple containing the longest path and its length.
     """
-    nodes = copy.deepcopy(bpmn_graph.get_nodes())
-    no_incoming_flow_nodes = []
-    for node in nodes:
-        if len(node.incoming) == 0:
-            no_incoming_flow_nodes.append(node)
+    no_incoming_flow_nodes = [node for node in bpmn_graph.nodes.values() if not node.incoming]
 
     longest_path = []
+    successors_cache = {}
+    acyclic_order = _get_acyclic_order(no_incoming_flow_nodes, bpmn_graph, successors_cache)
+    if acyclic_order is not None:
+        # without cycles the longest path from a node does not depend on how the node was reached
+        path_lengths, best_successors = _get_best_successors(acyclic_order, successors_cache, lambda node: True)
+        for node in no_incoming_flow_nodes:
+            if path_lengths[node.id] > len(longest_path):
+                longest_path = _follow_best_successors(node, best_successors)
+        return longest_path, len(longest_path)
+
     for node in no_incoming_flow_nodes:
-        (output_path, output_path_len) = find_longest_path([], node, bpmn_graph)
+        (output_path, output_path_len) = find_longest_path([], node, bpmn_graph, successors_cache=successors_cache)
         if output_path_len > len(longest_path):
             longest_path = output_path
     return longest_path, len(longest_path)
 
 
-def find_longest_path(previous_nodes: list[FlowNode], node: FlowNode, bpmn_graph: BpmnDiagramGraph) -> tuple[
-    list[FlowNode], int]:
+def find_longest_path(previous_nodes: list[FlowNode], node: FlowNode, bpmn_graph: BpmnDiagramGraph,
+                      visited_ids: set[str] | None = None,
+                      successors_cache: dict[str, list[FlowNode]] | None = None) -> tuple[list[FlowNode], int]:
     """
-    Recursively finds the longest path starting from a given node.
+    Finds the longest path starting from a given node, using depth-first search with an explicit stack.
+    The list of visited nodes is extended in place while the search goes deeper and restored before returning,
+    so only paths that are returned are copied.
 
     :param previous_nodes: List of nodes already visited.
     :param node: The current node.
     :param bpmn_graph: The BPMN graph object.
+    :param visited_ids: Optional set of IDs of nodes in previous_nodes, used for constant time membership checks.
+                        Built from previous_nodes if not given.
+    :param successors_cache: Optional dictionary of already resolved successors of nodes, keyed by node ID.
     :return: A tuple containing the longest path and its length.
     """
-    outgoing_flows_list = node.outgoing
-    longest_path = []
-
-    tmp_previous_nodes = copy.deepcopy(previous_nodes)
-    tmp_previous_nodes.append(node)
-
-    if len(outgoing_flows_list) == 0:
-        return tmp_previous_nodes, len(tmp_previous_nodes)
-
-    for outgoing_flow_id in outgoing_flows_list:
-        _, _, flow = bpmn_graph.get_flow_by_id(outgoing_flow_id)
-        _, outgoing_node = bpmn_graph.get_node_by_id(flow.target_ref_id)
-        if outgoing_node not in previous_nodes:
-            (output_path, output_path_len) = find_longest_path(tmp_previous_nodes, outgoing_node, bpmn_graph)
-            if output_path_len > len(longest_path):
-                longest_path = output_path
-    return longest_path, len(longest_path)
+    if len(node.outgoing) == 0:
+        return previous_nodes + [node], len(previous_nodes) + 1
+
+    if visited_ids is None:
+        visited_ids = {previous_node.id for previous_node in previous_nodes}
+    if successors_cache is None:
+        successors_cache = {}
+
+    # each frame holds a node of the current path, an iterator over its unvisited successors, the longest path
+    # found so far and whether the node has to be removed from visited_ids when the frame is left
+    # (a node reached through a self loop is already in the set and has to stay there)
+    stack = []
+    output_path = None
+    while True:
+        if node is not None:
+            if len(node.outgoing) == 0:
+                output_path = previous_nodes + [node]
+            else:
+                outgoing_nodes = [outgoing_node for outgoing_node in _get_successors(node, bpmn_graph, successors_cache)
+                                  if outgoing_node.id not in visited_ids]
+                stack.append([node, iter(outgoing_nodes), [], node.id not in visited_ids])
+                previous_nodes.append(node)
+                visited_ids.add(node.id)
+
+        frame = stack[-1]
+        if output_path is not None:
+            if len(output_path) > len(frame[2]):
+                frame[2] = output_path
+            output_path = None
+
+        node = next(frame[1], None)
+        if node is None:
+            stack.pop()
+            previous_nodes.pop()
+            if frame[3]:
+                visited_ids.discard(frame[0].id)
+            output_path = frame[2]
+            if not stack:
+                return output_path, len(output_path)
 
 
 def compute_longest_path_tasks(bpmn_graph: BpmnDiagramGraph) -> tuple[list[FlowNode], int]:
@@ -243,62 +314,205 @@ def compute_longest_path_tasks(bpmn_graph: BpmnDiagramGraph) -> tuple[list[FlowN
     :return: A tuple containing the longest path of tasks and its length.
     """
 
-    nodes = copy.deepcopy(bpmn_graph.get_nodes())
-    no_incoming_flow_nodes = []
-    for node in nodes:
-        if len(node.incoming) == 0:
-            no_incoming_flow_nodes.append(node)
+    no_incoming_flow_nodes = [node for node in bpmn_graph.nodes.values() if not node.incoming]
 
     longest_path = []
+    successors_cache = {}
+    acyclic_order = _get_acyclic_order(no_incoming_flow_nodes, bpmn_graph, successors_cache)
+    if acyclic_order is not None:
+        # without cycles the longest path from a node does not depend on how the node was reached
+        tasks_counts, best_successors = _get_best_successors(acyclic_order, successors_cache,
+                                                             lambda node: node.node_type in _TASK_NODE_TYPES)
+        for node in no_incoming_flow_nodes:
+            if tasks_counts[node.id] > len(longest_path):
+                longest_path = [path_node for path_node in _follow_best_successors(node, best_successors)
+                                if path_node.node_type in _TASK_NODE_TYPES]
+        return longest_path, len(longest_path)
+
     for node in no_incoming_flow_nodes:
-        (all_nodes, qualified_nodes) = find_longest_path_tasks([], [], node, bpmn_graph)
+        (all_nodes, qualified_nodes) = find_longest_path_tasks([], [], node, bpmn_graph,
+                                                               successors_cache=successors_cache)
         if len(qualified_nodes) > len(longest_path):
             longest_path = qualified_nodes
     return longest_path, len(longest_path)
 
 
 def find_longest_path_tasks(path: list[FlowNode], qualified_nodes: list[FlowNode], node: FlowNode,
-                            bpmn_graph: BpmnDiagramGraph) -> tuple[list[FlowNode], list[FlowNode]]:
+                            bpmn_graph: BpmnDiagramGraph,
+                            visited_ids: set[str] | None = None,
+                            successors_cache: dict[str, list[FlowNode]] | None = None
+                            ) -> tuple[list[FlowNode], list[FlowNode]]:
     """
-    Recursively finds the longest path consisting of tasks starting from a given node.
+    Finds the longest path consisting of tasks starting from a given node, using depth-first search with
+    an explicit stack. Both lists are extended in place while the search goes deeper and restored before returning,
+    so only paths that are returned are copied.
 
     :param path: List of nodes already visited.
     :param qualified_nodes: List of task nodes in the current path.
     :param node: The current node.
     :param bpmn_graph: The BPMN graph object.
+    :param visited_ids: Optional set of IDs of nodes in path, used for constant time membership checks.
+                        Built from path if not given.
+    :param successors_cache: Optional dictionary of already resolved successors of nodes, keyed by node ID.
     :return: A tuple containing all nodes in the path and the task nodes in the path.
     """
-    node_types = {NodeType.TASK, NodeType.SUB_PROCESS}
-    outgoing_flows_list = node.outgoing
-
-    if len(outgoing_flows_list) == 0:
-        tmp_path = copy.deepcopy(path)
-        tmp_path.append(node)
-        tmp_qualified_nodes = copy.deepcopy(qualified_nodes)
-        if node.node_type in node_types:
-            tmp_qualified_nodes.append(node)
-        return tmp_path, tmp_qualified_nodes
-    else:
-        longest_qualified_nodes = []
-        longest_path = copy.deepcopy(path)
-        longest_path.append(node)
-        for outgoing_flow_id in outgoing_flows_list:
-            _, _, flow = bpmn_graph.get_flow_by_id(outgoing_flow_id)
-            _, outgoing_node = bpmn_graph.get_node_by_id(flow.target_ref_id)
-            tmp_path = copy.deepcopy(path)
-            tmp_path.append(node)
-            tmp_qualified_nodes = copy.deepcopy(qualified_nodes)
-            if node.node_type in node_types:
-                tmp_qualified_nodes.append(node)
-
-            if outgoing_node not in path:
-                (path_all_nodes, path_qualified_nodes) = find_longest_path_tasks(tmp_path, tmp_qualified_nodes,
-                                                                                 outgoing_node, bpmn_graph)
-                if len(path_qualified_nodes) > len(longest_qualified_nodes):
-                    longest_qualified_nodes = path_qualified_nodes
-                    longest_path = path_all_nodes
+    if len(node.outgoing) == 0:
+        if node.node_type in _TASK_NODE_TYPES:
+            return path + [node], qualified_nodes + [node]
+        return path + [node], list(qualified_nodes)
+
+    if visited_ids is None:
+        visited_ids = {path_node.id for path_node in path}
+    if successors_cache is None:
+        successors_cache = {}
+
+    # each frame holds a node of the current path, an iterator over its successors (with a flag telling
+    # whether the successor is not visited yet), the longest path and its task nodes found so far, whether
+    # the node has to be removed from visited_ids when the frame is left and whether the node is a task
+    stack = []
+    output = None
+    while True:
+        if node is not None:
+            is_qualified = node.node_type in _TASK_NODE_TYPES
+            if len(node.outgoing) == 0:
+                output = path + [node], (qualified_nodes + [node] if is_qualified else list(qualified_nodes))
+            else:
+                outgoing_nodes = [(outgoing_node, outgoing_node.id not in visited_ids)
+                                  for outgoing_node in _get_successors(node, bpmn_graph, successors_cache)]
+                stack.append([node, iter(outgoing_nodes), path + [node], [], node.id not in visited_ids,
+                              is_qualified])
+                path.append(node)
+                visited_ids.add(node.id)
+                if is_qualified:
+                    qualified_nodes.append(node)
+
+        frame = stack[-1]
+        if output is not None:
+            (path_all_nodes, path_qualified_nodes) = output
+            if len(path_qualified_nodes) > len(frame[3]):
+                frame[2] = path_all_nodes
+                frame[3] = path_qualified_nodes
+            output = None
+
+        node = None
+        for outgoing_node, not_visited in frame[1]:
+            if not_visited:
+                node = outgoing_node
+                break
+            if len(qualified_nodes) > len(frame[3]):
+                frame[2] = list(path)
+                frame[3] = list(qualified_nodes)
+
+        if node is None:
+            stack.pop()
+            path.pop()
+            if frame[4]:
+                visited_ids.discard(frame[0].id)
+            if frame[5]:
+                qualified_nodes.pop()
+            output = frame[2], frame[3]
+            if not stack:
+                return output
+
+
+def _get_successors(node: FlowNode, bpmn_graph: BpmnDiagramGraph,
+                    successors_cache: dict[str, list[FlowNode]]) -> list[FlowNode]:
+    """
+    Returns target nodes of all outgoing flows of a given node, in the order of the flows.
+    Flows and nodes are read straight from the graph dictionaries and the result is stored in the cache,
+    so successors of each node are resolved once per metric computation.
+
+    :param node: The node.
+    :param bpmn_graph: The BPMN graph object.
+    :param successors_cache: Dictionary of already resolved successors of nodes, keyed by node ID.
+    :return: A list of successor nodes.
+    """
+    successors = successors_cache.get(node.id)
+    if successors is None:
+        # message flows take precedence, as in BpmnDiagramGraph.get_flow_by_id
+        message_flows = bpmn_graph.message_flows
+        sequence_flows = bpmn_graph.sequence_flows
+        nodes = bpmn_graph.nodes
+        successors = []
+        for outgoing_flow_id in node.outgoing:
+            flow = message_flows[outgoing_flow_id] if outgoing_flow_id in message_flows \
+                else sequence_flows[outgoing_flow_id]
+            successors.append(nodes[flow.target_ref_id])
+        successors_cache[node.id] = successors
+    return successors
+
+
+def _get_acyclic_order(start_nodes: list[FlowNode], bpmn_graph: BpmnDiagramGraph,
+                       successors_cache: dict[str, list[FlowNode]]) -> list[FlowNode] | None:
+    """
+    Orders nodes reachable from the start nodes so that every node comes after all of its successors.
+
+    :param start_nodes: List of nodes to start from.
+    :param bpmn_graph: The BPMN graph object.
+    :param successors_cache: Dictionary of already resolved successors of nodes, keyed by node ID.
+                             Successors of all reached nodes are added to it.
+    :return: List of ordered nodes, or None if there is a cycle reachable from the start nodes.
+    """
+    finished = {}
+    order = []
+    for start_node in start_nodes:
+        if start_node.id in finished:
+            continue
+        finished[start_node.id] = False
+        stack = [(start_node, iter(_get_successors(start_node, bpmn_graph, successors_cache)))]
+        while stack:
+            node, successors_iter = stack[-1]
+            for successor in successors_iter:
+                successor_finished = finished.get(successor.id)
+                if successor_finished is None:
+                    finished[successor.id] = False
+                    stack.append((successor, iter(_get_successors(successor, bpmn_graph, successors_cache))))
+                    break
+                if not successor_finished:
+                    # successor is still on the stack
+                    return None
             else:
-                if len(tmp_qualified_nodes) > len(longest_qualified_nodes):
-                    longest_qualified_nodes = tmp_qualified_nodes
-                    longest_path = tmp_path
-        return longest_path, longest_qualified_nodes
+                stack.pop()
+                finished[node.id] = True
+                order.append(node)
+    return order
+
+
+def _get_best_successors(order: list[FlowNode], successors: dict[str, list[FlowNode]],
+                         is_counted: Callable[[FlowNode], bool]) -> tuple[dict[str, int], dict[str, FlowNode | None]]:
+    """
+    Computes, for every node of an acyclic graph, the highest number of counted nodes on a path starting from it
+    and the successor this path continues with. The first of equally good successors is chosen.
+
+    :param order: Nodes ordered so that every node comes after all of its successors.
+    :param successors: A dictionary of successors of each node.
+    :param is_counted: Function deciding whether a node is counted.
+    :return: A tuple containing dictionaries of counts and best successors, both keyed by node ID.
+    """
+    counts = {}
+    best_successors = {}
+    for node in order:
+        best_count = 0
+        best_successor = None
+        for successor in successors[node.id]:
+            if best_successor is None or counts[successor.id] > best_count:
+                best_count = counts[successor.id]
+                best_successor = successor
+        counts[node.id] = best_count + 1 if is_counted(node) else best_count
+        best_successors[node.id] = best_successor
+    return counts, best_successors
+
+
+def _follow_best_successors(node: FlowNode, best_successors: dict[str, FlowNode | None]) -> list[FlowNode]:
+    """
+    Builds a path starting from a given node by following best successors.
+
+    :param node: The first node of the path.
+    :param best_successors: A dictionary of best successors of each node.
+    :return: List of nodes in the path.
+    """
+    path = []
+    while node is not None:
+        path.append(node)
+        node = best_successors[node.id]
+    return path
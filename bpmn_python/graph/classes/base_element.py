@@ -3,7 +3,7 @@
 Class used for representing tBaseElement of BPMN 2.0 graph
 """
 
-from typing import Optional
+from typing import Optional, Self
 
 from pydantic import BaseModel, Field
 
@@ -15,3 +15,15 @@ class BaseElement(BaseModel):
     - id: an ID of element. Must be either None (ID is optional according to BPMN 2.0 XML Schema) or String.
     """
     id: Optional[str] = Field(default=None)
+
+    @classmethod
+    def from_trusted(cls, **data) -> Self:
+        """
+        Creates an instance from data that already has correct types, skipping pydantic validation.
+        Fields that are not given get their default values. Meant for importers that build elements from parsed
+        documents; values passed by users should go through the regular constructor.
+
+        :param data: field values of the created element.
+        :return: new instance of the class.
+        """
+        return cls.model_construct(**data)
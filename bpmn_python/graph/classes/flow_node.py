@@ -49,6 +49,13 @@ class FlowNode(FlowElement):
     outgoing: List[str] = Field(default_factory=list, description="List of IDs of outgoing flows")
     process_id: str | None = Field(default=None, description="ID of the related process")
     node_type: ClassVar[NodeType] = NodeType.BASE
+    node_type_str: ClassVar[str] = NodeType.BASE.value
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Plain copy of node_type.value, read once per node by the exporters
+        cls.node_type_str = cls.node_type.value
 
     def degree(self) -> int:
         return len(self.incoming) + len(self.outgoing)
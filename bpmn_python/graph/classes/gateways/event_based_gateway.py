@@ -18,11 +18,21 @@ class EventBasedGatewayType(Enum):
 
     @classmethod
     def parse(cls, value: str) -> "EventBasedGatewayType":
-        value_lower = value.lower()
-        for member in cls:
-            if member.name.lower() == value_lower or str(member.value).lower() == value_lower:
-                return member
-        raise ValueError(f"Invalid EventBasedGatewayType value: {value}")
+        member = _EVENT_BASED_GATEWAY_TYPE_BY_NAME.get(value)
+        if member is not None:
+            return member
+        try:
+            return _EVENT_BASED_GATEWAY_TYPE_BY_NAME[value.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid EventBasedGatewayType value: {value}") from None
+
+
+_EVENT_BASED_GATEWAY_TYPE_BY_NAME = {
+    **{member.name.lower(): member for member in EventBasedGatewayType},
+    **{str(member.value).lower(): member for member in EventBasedGatewayType},
+    **{member.name: member for member in EventBasedGatewayType},
+    **{member.value: member for member in EventBasedGatewayType},
+}
 
 
 class EventBasedGateway(Gateway):
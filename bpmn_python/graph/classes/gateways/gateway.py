@@ -18,11 +18,22 @@ class GatewayDirection(Enum):
 
     @classmethod
     def parse(cls, value: str) -> "GatewayDirection":
-        value_lower = value.lower()
-        for member in cls:
-            if member.name.lower() == value_lower or str(member.value).lower() == value_lower:
-                return member
-        raise ValueError(f"Invalid GatewayDirection value: {value}")
+        member = _GATEWAY_DIRECTION_BY_NAME.get(value)
+        if member is not None:
+            return member
+        try:
+            return _GATEWAY_DIRECTION_BY_NAME[value.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid GatewayDirection value: {value}") from None
+
+
+# Member names and values, both as written and lower-cased, mapped to members
+_GATEWAY_DIRECTION_BY_NAME = {
+    **{member.name.lower(): member for member in GatewayDirection},
+    **{str(member.value).lower(): member for member in GatewayDirection},
+    **{member.name: member for member in GatewayDirection},
+    **{member.value: member for member in GatewayDirection},
+}
 
 
 class Gateway(FlowNode):
@@ -46,5 +46,5 @@ class Lane(BaseElement):
                                 description="Indicates if the lane is horizontal or vertical. Its value in xml is stored in a separate element.")
 
 
-Lane.model_rebuild()
+# Lane is complete once defined; only LaneSet still holds the "Lane" forward reference
 LaneSet.model_rebuild()
@@ -20,65 +20,72 @@ class EventDefinitionType(Enum):
     ERROR = "errorEventDefinition"
 
 
+START_EVENT_DEFINITION_TYPES: frozenset[EventDefinitionType] = frozenset({
+    EventDefinitionType.MESSAGE,
+    EventDefinitionType.TIMER,
+    EventDefinitionType.CONDITIONAL,
+    EventDefinitionType.SIGNAL,
+    EventDefinitionType.ESCALATION
+})
+END_EVENT_DEFINITION_TYPES: frozenset[EventDefinitionType] = frozenset({
+    EventDefinitionType.MESSAGE,
+    EventDefinitionType.SIGNAL,
+    EventDefinitionType.ESCALATION,
+    EventDefinitionType.TERMINATE,
+    EventDefinitionType.COMPENSATE,
+    EventDefinitionType.ERROR
+})
+INTERMEDIATE_THROW_EVENT_DEFINITION_TYPES: frozenset[EventDefinitionType] = frozenset({
+    EventDefinitionType.MESSAGE,
+    EventDefinitionType.SIGNAL,
+    EventDefinitionType.ESCALATION,
+    EventDefinitionType.COMPENSATE
+})
+INTERMEDIATE_CATCH_EVENT_DEFINITION_TYPES: frozenset[EventDefinitionType] = frozenset({
+    EventDefinitionType.MESSAGE,
+    EventDefinitionType.TIMER,
+    EventDefinitionType.SIGNAL,
+    EventDefinitionType.CONDITIONAL,
+    EventDefinitionType.ESCALATION
+})
+BOUNDARY_EVENT_DEFINITION_TYPES: frozenset[EventDefinitionType] = frozenset({
+    EventDefinitionType.MESSAGE,
+    EventDefinitionType.TIMER,
+    EventDefinitionType.SIGNAL,
+    EventDefinitionType.CONDITIONAL,
+    EventDefinitionType.ESCALATION,
+    EventDefinitionType.ERROR
+})
+
+
 class StartEventDefinitionTypes:
     @staticmethod
-    def getTypes() -> set[EventDefinitionType]:
-        return {
-            EventDefinitionType.MESSAGE,
-            EventDefinitionType.TIMER,
-            EventDefinitionType.CONDITIONAL,
-            EventDefinitionType.SIGNAL,
-            EventDefinitionType.ESCALATION
-        }
+    def getTypes() -> frozenset[EventDefinitionType]:
+        return START_EVENT_DEFINITION_TYPES
 
 
 class EndEventDefinitionTypes:
     @staticmethod
-    def getTypes() -> set[EventDefinitionType]:
-        return {
-            EventDefinitionType.MESSAGE,
-            EventDefinitionType.SIGNAL,
-            EventDefinitionType.ESCALATION,
-            EventDefinitionType.TERMINATE,
-            EventDefinitionType.COMPENSATE,
-            EventDefinitionType.ERROR
-        }
+    def getTypes() -> frozenset[EventDefinitionType]:
+        return END_EVENT_DEFINITION_TYPES
 
 
 class IntermediateThrowEventDefinitionTypes:
     @staticmethod
-    def getTypes() -> set[EventDefinitionType]:
-        return {
-            EventDefinitionType.MESSAGE,
-            EventDefinitionType.SIGNAL,
-            EventDefinitionType.ESCALATION,
-            EventDefinitionType.COMPENSATE
-        }
+    def getTypes() -> frozenset[EventDefinitionType]:
+        return INTERMEDIATE_THROW_EVENT_DEFINITION_TYPES
 
 
 class IntermediateCatchEventDefinitionTypes:
     @staticmethod
-    def getTypes() -> set[EventDefinitionType]:
-        return {
-            EventDefinitionType.MESSAGE,
-            EventDefinitionType.TIMER,
-            EventDefinitionType.SIGNAL,
-            EventDefinitionType.CONDITIONAL,
-            EventDefinitionType.ESCALATION
-        }
+    def getTypes() -> frozenset[EventDefinitionType]:
+        return INTERMEDIATE_CATCH_EVENT_DEFINITION_TYPES
 
 
 class BoundaryEventDefinitionTypes:
     @staticmethod
-    def getTypes() -> set[EventDefinitionType]:
-        return {
-            EventDefinitionType.MESSAGE,
-            EventDefinitionType.TIMER,
-            EventDefinitionType.SIGNAL,
-            EventDefinitionType.CONDITIONAL,
-            EventDefinitionType.ESCALATION,
-            EventDefinitionType.ERROR
-        }
+    def getTypes() -> frozenset[EventDefinitionType]:
+        return BOUNDARY_EVENT_DEFINITION_TYPES
 
 
 class EventDefinition(RootElement):
@@ -38,8 +38,13 @@ class ProcessType(Enum):
         :param value: The string value to parse.
         :return: Corresponding ProcessType enum member.
         """
-        value_lower = value.strip().lower()
-        for member in cls:
-            if member.name.lower() == value_lower or str(member.value).lower() == value_lower:
-                return member
-        raise ValueError(f"Invalid ProcessType value: {value}")
+        try:
+            return _PROCESS_TYPE_BY_NAME[value.strip().lower()]
+        except KeyError:
+            raise ValueError(f"Invalid ProcessType value: {value}") from None
+
+
+_PROCESS_TYPE_BY_NAME = {
+    **{member.name.lower(): member for member in ProcessType},
+    **{str(member.value).lower(): member for member in ProcessType},
+}
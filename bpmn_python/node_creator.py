@@ -17,56 +17,43 @@ from bpmn_python.graph.classes.gateways.inclusive_gateway import InclusiveGatewa
 from bpmn_python.graph.classes.gateways.parallel_gateway import ParallelGateway
 
 
-def create_node(node_type: NodeType, node_id: str, process_id: str) -> FlowNode:
+_NODE_CLASS_BY_TYPE: dict[NodeType, type[FlowNode]] = {
+    NodeType.START: StartEvent,
+    NodeType.END: EndEvent,
+    NodeType.INTERMEDIATE_THROW: IntermediateThrowEvent,
+    NodeType.INTERMEDIATE_CATCH: IntermediateCatchEvent,
+    NodeType.BOUNDARY: BoundaryEvent,
+    NodeType.EXCLUSIVE: ExclusiveGateway,
+    NodeType.INCLUSIVE: InclusiveGateway,
+    NodeType.PARALLEL: ParallelGateway,
+    NodeType.COMPLEX: ComplexGateway,
+    NodeType.EVENT_BASED: EventBasedGateway,
+    NodeType.TASK: Task,
+    NodeType.SERVICE_TASK: ServiceTask,
+    NodeType.MANUAL_TASK: ManualTask,
+    NodeType.USER_TASK: UserTask,
+    NodeType.SUB_PROCESS: SubProcess,
+    NodeType.DATA_OBJECT: DataObject,
+}
+_NODE_TYPE_BY_VALUE = {member.value.lower(): member for member in NodeType}
+
+
+def create_node(node_type: NodeType, node_id: str, process_id: str, trusted: bool = False) -> FlowNode:
     """
     Factory function to create a FlowNode instance based on the specified node type.
 
     :param node_type: Type of the node (NodeType).
     :param node_id: Unique identifier for the node.
     :param process_id: Identifier of the process to which the node belongs.
+    :param trusted: If True, node_id and process_id are known to be strings (e.g. read by an importer) and
+                    validation is skipped. Values supplied by users must keep the default.
     :return: An instance of FlowNode or its subclass based on the node_type.
     """
-    match node_type:
-        case NodeType.START:
-            node = StartEvent(id=node_id, process_id=process_id)
-        case NodeType.END:
-            node = EndEvent(id=node_id, process_id=process_id)
-        case NodeType.INTERMEDIATE_THROW:
-            node = IntermediateThrowEvent(id=node_id, process_id=process_id)
-        case NodeType.INTERMEDIATE_CATCH:
-            node = IntermediateCatchEvent(id=node_id, process_id=process_id)
-        case NodeType.BOUNDARY:
-            node = BoundaryEvent(id=node_id, process_id=process_id)
-        case NodeType.EXCLUSIVE:
-            node = ExclusiveGateway(id=node_id, process_id=process_id)
-        case NodeType.INCLUSIVE:
-            node = InclusiveGateway(id=node_id, process_id=process_id)
-        case NodeType.PARALLEL:
-            node = ParallelGateway(id=node_id, process_id=process_id)
-        case NodeType.COMPLEX:
-            node = ComplexGateway(id=node_id, process_id=process_id)
-        case NodeType.EVENT_BASED:
-            node = EventBasedGateway(id=node_id, process_id=process_id)
-        case NodeType.TASK:
-            node = Task(id=node_id, process_id=process_id)
-        case NodeType.SERVICE_TASK:
-            node = ServiceTask(id=node_id, process_id=process_id)
-        case NodeType.MANUAL_TASK:
-            node = ManualTask(id=node_id, process_id=process_id)
-        case NodeType.USER_TASK:
-            node = UserTask(id=node_id, process_id=process_id)
-        case NodeType.SUB_PROCESS:
-            node = SubProcess(id=node_id, process_id=process_id)
-        case NodeType.DATA_OBJECT:
-            node = DataObject(id=node_id, process_id=process_id)
-        case _:
-            node = FlowNode(id=node_id, process_id=process_id)
-
-    return node
+    node_class = _NODE_CLASS_BY_TYPE.get(node_type, FlowNode)
+    if trusted:
+        return node_class.from_trusted(id=node_id, process_id=process_id)
+    return node_class(id=node_id, process_id=process_id)
 
 
 def parse_node_type(value: str) -> NodeType:
-    for member in NodeType:
-        if member.value.lower() == value.lower():
-            return member
-    return NodeType.BASE
+    return _NODE_TYPE_BY_VALUE.get(value.lower(), NodeType.BASE)
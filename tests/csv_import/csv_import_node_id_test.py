@@ -0,0 +1,66 @@
+# coding=utf-8
+"""
+Unit tests checking that node ID parsing helpers of CSV import agree with the regular expressions they replace.
+"""
+import re
+
+import pytest
+
+from bpmn_python.bpmn_process_csv_import import regex_pa_trailing_number, regex_pa_trailing_letter, \
+    regex_pa_merge_node_finder, regex_pa_num_let, regex_suffix_split_succ, _split_trailing_digits, \
+    _has_letter_after_first_char, _find_num_letter_spans, get_possible_merge_continuation_successors, \
+    get_split_successors_index
+
+NODE_IDS = [
+    "", "1", "12", "a", "3a", "a1", "ab1", "1a1", "2a3b1", "10b2c11", "3a11", "3b1a1",
+    # "$" also matches before a single trailing new line, "." never matches a new line
+    "1\n", "1a1\n", "3a\n", "a\n1", "\n1", "1a2\nb3", "1a\n2b", "1\n\n",
+    # prefix is a single non-letter, or empty
+    "-1", "x-1", "--1", " 1", "a 1",
+    # only ASCII digits and letters count
+    "é1", "1é1", "1١", "١a1", "1ª2",
+]
+
+
+def merge_successors_by_regex(node_id: str) -> list[str]:
+    result_trailing_number = re.match(regex_pa_trailing_number, node_id)
+    if result_trailing_number:
+        node_id = result_trailing_number.group(1)
+    if not re.match(regex_pa_trailing_letter, node_id):
+        return []
+    possible_successors = []
+    for result in re.finditer(regex_pa_merge_node_finder, node_id):
+        num = re.match(regex_pa_num_let, result.group(2)).group(1)
+        possible_successors.append(result.group(1) + str(int(num) + 1))
+    return possible_successors
+
+
+@pytest.mark.parametrize("node_id", NODE_IDS)
+def test_split_trailing_digits_matches_regex(node_id: str) -> None:
+    result = re.match(regex_pa_trailing_number, node_id)
+    assert _split_trailing_digits(node_id) == (result.groups() if result else None)
+
+
+@pytest.mark.parametrize("node_id", NODE_IDS)
+def test_has_letter_after_first_char_matches_regex(node_id: str) -> None:
+    assert _has_letter_after_first_char(node_id) == bool(re.match(regex_pa_trailing_letter, node_id))
+
+
+@pytest.mark.parametrize("node_id", NODE_IDS)
+def test_find_num_letter_spans_matches_regex(node_id: str) -> None:
+    expected = [(result.group(1), re.match(regex_pa_num_let, result.group(2)).group(1))
+                for result in re.finditer(regex_pa_merge_node_finder, node_id)]
+    assert list(_find_num_letter_spans(node_id)) == expected
+
+
+@pytest.mark.parametrize("node_id", NODE_IDS)
+def test_merge_continuation_successors_match_regex(node_id: str) -> None:
+    assert get_possible_merge_continuation_successors(node_id) == merge_successors_by_regex(node_id)
+
+
+@pytest.mark.parametrize("next_node_id", ["1", "3", "2a3", "a1", "10"])
+def test_split_successors_index_matches_regex(next_node_id: str) -> None:
+    nodes_ids = NODE_IDS + ["1a", "1b1", "1c11", "1ab", "11a", "1a\n", "3a1", "3é", "2a3b", "2a3b11", "10a"]
+    expected = [elem for elem in nodes_ids
+                if elem.startswith(next_node_id) and re.match(regex_suffix_split_succ, elem[len(next_node_id):])]
+    assert get_split_successors_index(nodes_ids).get(next_node_id, []) == expected
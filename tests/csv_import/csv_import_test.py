@@ -5,6 +5,8 @@ Unit tests for exporting process to CSV functionality.
 
 import filecmp
 import os
+import shutil
+import tempfile
 import unittest
 
 import bpmn_python.bpmn_diagram_rep as diagram
@@ -31,6 +33,40 @@ class CsvExportTests(unittest.TestCase):
             # unittest.TestCase.assertTrue(self, cmp_result) # unfortunatelly csv export has bugs
             BpmnDiagramGraphExport.export_xml_file_no_di(self.output_directory, process + ".bpmn", bpmn_graph)
 
+    def test_csv_import_repeated_load_returns_independent_diagrams(self) -> None:
+        filepath = os.path.abspath(self.input_directory + "pizza-order.csv")
+        first_graph = diagram.BpmnDiagramGraph()
+        BpmnDiagramGraphCSVImport.load_diagram_from_csv(filepath, first_graph)
+        first_graph.nodes["0"].name = "changed"
+        del first_graph.sequence_flows[next(iter(first_graph.sequence_flows))]
+
+        second_graph = diagram.BpmnDiagramGraph()
+        BpmnDiagramGraphCSVImport.load_diagram_from_csv(filepath, second_graph)
+        self.assertEqual(second_graph.nodes["0"].name, "Receive pizza order")
+        self.assertEqual(len(second_graph.sequence_flows), len(first_graph.sequence_flows) + 1)
+        self.assertIs(second_graph.process_elements["process_1"].flow_element_list[0], second_graph.nodes["0"])
+
+    def test_csv_import_reloads_file_rewritten_with_preserved_mtime(self) -> None:
+        temp_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_directory.cleanup)
+        filepath = os.path.join(temp_directory.name, "pizza-order.csv")
+        shutil.copyfile(self.input_directory + "pizza-order.csv", filepath)
+        file_stat = os.stat(filepath)
+        first_graph = diagram.BpmnDiagramGraph()
+        BpmnDiagramGraphCSVImport.load_diagram_from_csv(filepath, first_graph)
+        self.assertEqual(first_graph.nodes["0"].name, "Receive pizza order")
+
+        # same size and modification time, as left behind by "cp -p" or "rsync -t"
+        with open(filepath, encoding="utf-8") as csv_file:
+            content = csv_file.read()
+        with open(filepath, "w", encoding="utf-8", newline="") as csv_file:
+            csv_file.write(content.replace("Receive pizza order", "Receive pizza ORDER"))
+        os.utime(filepath, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+
+        second_graph = diagram.BpmnDiagramGraph()
+        BpmnDiagramGraphCSVImport.load_diagram_from_csv(filepath, second_graph)
+        self.assertEqual(second_graph.nodes["0"].name, "Receive pizza ORDER")
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,7 @@ import unittest
 import bpmn_python.diagram_layout_metrics as metrics
 import bpmn_python.bpmn_diagram_rep as diagram
 from bpmn_python.bpmn_diagram_rep import BpmnDiagramGraph
+from bpmn_python.graph.classes.flow_node import NodeType
 
 
 class MetricsTests(unittest.TestCase):
@@ -20,11 +21,61 @@ class MetricsTests(unittest.TestCase):
         bpmn_graph.load_diagram_from_xml_file(os.path.abspath(filepath))
         return bpmn_graph
 
+    @staticmethod
+    def build_diagram(task_ids: list[str], edges: list[tuple[str, str]],
+                      gateway_ids: list[str] | None = None) -> BpmnDiagramGraph:
+        bpmn_graph = diagram.BpmnDiagramGraph()
+        bpmn_graph.create_new_diagram_graph()
+        process_id = bpmn_graph.add_process_to_diagram()
+        for task_id in task_ids:
+            bpmn_graph.add_modify_task_to_diagram(process_id, task_id, node_id=task_id)
+        for gateway_id in gateway_ids or []:
+            bpmn_graph.add_modify_gateway_to_diagram(process_id, NodeType.EXCLUSIVE, gateway_id, node_id=gateway_id)
+        for index, (source_id, target_id) in enumerate(edges):
+            bpmn_graph.add_modify_sequence_flow_to_diagram(process_id, source_id, target_id,
+                                                           sequence_flow_id="flow_" + str(index))
+        return bpmn_graph
+
+    @staticmethod
+    def build_diagram_with_waypoints(flows_waypoints: list[list[tuple[float, float]]]) -> BpmnDiagramGraph:
+        bpmn_graph = MetricsTests.build_diagram(["a", "b"], [("a", "b")] * len(flows_waypoints))
+        for index, waypoints in enumerate(flows_waypoints):
+            bpmn_graph.sequence_flows["flow_" + str(index)].waypoints = waypoints
+        return bpmn_graph
+
     def test_count_crossing_points(self) -> None:
         bpmn_graph = MetricsTests.load_example_diagram(self.crossing_points_example_path)
         cross_points = metrics.count_crossing_points(bpmn_graph)
         self.assertEqual(cross_points, 6, "Crossing points count does not match")
 
+    def test_count_crossing_points_collinear_segments(self) -> None:
+        cases = {
+            "overlap": ([[(0.0, 0.0), (10.0, 0.0)], [(5.0, 0.0), (15.0, 0.0)]], 1),
+            "contained": ([[(0.0, 0.0), (20.0, 0.0)], [(5.0, 0.0), (15.0, 0.0)]], 1),
+            "vertical overlap": ([[(0.0, 0.0), (0.0, 10.0)], [(0.0, 5.0), (0.0, 15.0)]], 1),
+            "disjoint": ([[(0.0, 0.0), (1.0, 0.0)], [(2.0, 0.0), (3.0, 0.0)]], 0),
+            "crossing": ([[(0.0, 0.0), (10.0, 10.0)], [(0.0, 10.0), (10.0, 0.0)]], 1),
+            "touching interior": ([[(0.0, 0.0), (10.0, 0.0)], [(5.0, 0.0), (5.0, 10.0)]], 1),
+        }
+        for name, (flows_waypoints, expected) in cases.items():
+            with self.subTest(name):
+                bpmn_graph = MetricsTests.build_diagram_with_waypoints(flows_waypoints)
+                self.assertEqual(metrics.count_crossing_points(bpmn_graph), expected)
+
+    def test_count_crossing_points_shared_endpoints(self) -> None:
+        cases = {
+            "collinear, touching": ([[(0.0, 0.0), (10.0, 0.0)], [(10.0, 0.0), (20.0, 0.0)]], 0),
+            "collinear, overlapping": ([[(0.0, 0.0), (10.0, 0.0)], [(0.0, 0.0), (20.0, 0.0)]], 0),
+            "diverging": ([[(0.0, 0.0), (10.0, 10.0)], [(0.0, 0.0), (10.0, -10.0)]], 0),
+            "identical": ([[(0.0, 0.0), (10.0, 10.0)], [(0.0, 0.0), (10.0, 10.0)]], 0),
+            "consecutive segments of one flow": ([[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0)]], 0),
+            "polylines": ([[(0.0, 0.0), (10.0, 0.0), (10.0, 10.0)], [(5.0, -5.0), (5.0, 5.0), (15.0, 5.0)]], 2),
+        }
+        for name, (flows_waypoints, expected) in cases.items():
+            with self.subTest(name):
+                bpmn_graph = MetricsTests.build_diagram_with_waypoints(flows_waypoints)
+                self.assertEqual(metrics.count_crossing_points(bpmn_graph), expected)
+
     def test_count_segments(self) -> None:
         bpmn_graph = MetricsTests.load_example_diagram(self.crossing_points_example_path)
         segments_count = metrics.count_segments(bpmn_graph)
@@ -40,6 +91,78 @@ class MetricsTests(unittest.TestCase):
         (longest_path, longest_path_len) = metrics.compute_longest_path_tasks(bpmn_graph)
         self.assertEqual(longest_path_len, 6, "Path length does not match")
 
+    def test_compute_longest_path_with_self_loop(self) -> None:
+        bpmn_graph = MetricsTests.build_diagram(["start", "a", "end"], [("start", "a"), ("a", "a"), ("a", "end")])
+        for compute in (metrics.compute_longest_path, metrics.compute_longest_path_tasks):
+            with self.subTest(compute=compute.__name__):
+                (longest_path, longest_path_len) = compute(bpmn_graph)
+                # a self loop is followed once, so the looping node appears twice
+                self.assertEqual([node.id for node in longest_path], ["start", "a", "a", "end"])
+                self.assertEqual(longest_path_len, 4)
+
+    def test_compute_longest_path_with_self_loop_and_no_exit(self) -> None:
+        bpmn_graph = MetricsTests.build_diagram(["start", "a"], [("start", "a"), ("a", "a")])
+        # every successor of "a" is visited, so no path ends at a node without outgoing flows
+        self.assertEqual(metrics.compute_longest_path(bpmn_graph), ([], 0))
+        (longest_path, longest_path_len) = metrics.compute_longest_path_tasks(bpmn_graph)
+        self.assertEqual([node.id for node in longest_path], ["start", "a", "a"])
+        self.assertEqual(longest_path_len, 3)
+
+    def test_compute_longest_path_with_cycle(self) -> None:
+        bpmn_graph = MetricsTests.build_diagram(["start", "a", "b", "end"],
+                                                [("start", "a"), ("a", "b"), ("b", "a"), ("b", "end")])
+        for compute in (metrics.compute_longest_path, metrics.compute_longest_path_tasks):
+            with self.subTest(compute=compute.__name__):
+                (longest_path, longest_path_len) = compute(bpmn_graph)
+                self.assertEqual([node.id for node in longest_path], ["start", "a", "b", "end"])
+                self.assertEqual(longest_path_len, 4)
+
+    def test_find_longest_path_with_cycle_back_to_start_node(self) -> None:
+        bpmn_graph = MetricsTests.build_diagram(["a", "b", "c"], [("a", "b"), ("b", "c"), ("c", "a")])
+        self.assertEqual(metrics.compute_longest_path(bpmn_graph), ([], 0))
+        self.assertEqual(metrics.compute_longest_path_tasks(bpmn_graph), ([], 0))
+        start_node = bpmn_graph.nodes["a"]
+        self.assertEqual(metrics.find_longest_path([], start_node, bpmn_graph), ([], 0))
+        (all_nodes, qualified_nodes) = metrics.find_longest_path_tasks([], [], start_node, bpmn_graph)
+        self.assertEqual([node.id for node in all_nodes], ["a", "b", "c"])
+        self.assertEqual([node.id for node in qualified_nodes], ["a", "b", "c"])
+
+        bpmn_graph = MetricsTests.build_diagram(["a", "b", "c", "end"],
+                                                [("a", "b"), ("b", "c"), ("c", "a"), ("c", "end")])
+        start_node = bpmn_graph.nodes["a"]
+        (longest_path, longest_path_len) = metrics.find_longest_path([], start_node, bpmn_graph)
+        self.assertEqual([node.id for node in longest_path], ["a", "b", "c", "end"])
+        self.assertEqual(longest_path_len, 4)
+        (all_nodes, qualified_nodes) = metrics.find_longest_path_tasks([], [], start_node, bpmn_graph)
+        self.assertEqual([node.id for node in qualified_nodes], ["a", "b", "c", "end"])
+
+    def test_compute_longest_path_tied_successors(self) -> None:
+        edges = [("start", "a"), ("start", "b"), ("a", "end_a"), ("b", "end_b")]
+        # the second diagram has a cycle, so the depth-first search is used instead of the acyclic one
+        for cyclic in (False, True):
+            task_ids = ["start", "a", "b", "end_a", "end_b"] + (["c"] if cyclic else [])
+            bpmn_graph = MetricsTests.build_diagram(task_ids, edges + ([("c", "c")] if cyclic else []))
+            for compute in (metrics.compute_longest_path, metrics.compute_longest_path_tasks):
+                with self.subTest(cyclic=cyclic, compute=compute.__name__):
+                    # paths of equal length are resolved in favour of the first outgoing flow
+                    (longest_path, longest_path_len) = compute(bpmn_graph)
+                    self.assertEqual([node.id for node in longest_path], ["start", "a", "end_a"])
+                    self.assertEqual(longest_path_len, 3)
+
+    def test_compute_longest_path_tasks_tied_task_counts(self) -> None:
+        edges = [("start", "t2"), ("start", "g1"), ("g1", "t1"), ("t1", "e1"), ("t2", "e2")]
+        for cyclic in (False, True):
+            task_ids = ["start", "t1", "t2"] + (["c"] if cyclic else [])
+            bpmn_graph = MetricsTests.build_diagram(task_ids, edges + ([("c", "c")] if cyclic else []),
+                                                    gateway_ids=["g1", "e1", "e2"])
+            with self.subTest(cyclic=cyclic):
+                (longest_path, longest_path_len) = metrics.compute_longest_path(bpmn_graph)
+                self.assertEqual([node.id for node in longest_path], ["start", "g1", "t1", "e1"])
+                # both branches hold two tasks, the first outgoing flow wins although its path is shorter
+                (longest_path, longest_path_len) = metrics.compute_longest_path_tasks(bpmn_graph)
+                self.assertEqual([node.id for node in longest_path], ["start", "t2"])
+                self.assertEqual(longest_path_len, 2)
+
 
 if __name__ == '__main__':
     unittest.main()